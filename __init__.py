@@ -16,30 +16,136 @@ bl_info = {
 
 import bpy
 import re
+import os
+import sys
+import csv
+import json
+import gc
+import time
+import argparse
+import cProfile
+import contextlib
+import collections
+import concurrent.futures
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+import numpy as np
+try:
+    import resource
+except ImportError:
+    resource = None  # not available on windows
+try:
+    from mathutils import Vector
+    from mathutils.bvhtree import BVHTree
+except ImportError:
+    BVHTree = None   # blender < 2.76
+
+
+# compiled name patterns used by `HiloDetectMeshGroupByNamePattern`
+# key: (kind, name pattern, lowpoly suffix, highpoly suffix, group name, helper name)
+hilo_pattern_cache = {}
+
+
+# per-scene object classification caches
+# key: scene name, value: `HiloClassificationCache`
+hilo_classification_caches = {}
+hilo_uv_caches = {}
+# coverage results of `HiloCoverageAnalyzer`, key: geometry hash of the final meshes
+hilo_coverage_cache = collections.OrderedDict()
+# names of scenes whose group overview (`Scene.hilo_groupsummary`) has an up to date dirty state
+hilo_group_summaries_current = set()
+# names of scenes whose group overview matches the current mesh group membership
+hilo_group_summaries_valid = set()
+# names of scenes whose overview panel asked for an update, panels can't write scene data
+hilo_group_summaries_requested = set()
+# last seen (object count, active object pointer, active object name) per scene name
+hilo_group_summary_state = {}
+
+
+def hilo_scene_settings_update(self, context):
+    # mesh group settings have changed, drop the compiled name patterns
+    hilo_pattern_cache.clear()
+    # ... and the scene's object classifications
+    if (self.name in hilo_classification_caches):
+        hilo_classification_caches[self.name].invalidate()
+    hilo_group_summaries_current.discard(self.name)
+    hilo_group_summaries_valid.discard(self.name)
+
+
+def hilo_object_settings_update(self, context):
+    # mesh type or mesh group of an object has changed, classify it again
+    for cache in hilo_classification_caches.values():
+        cache.invalidate([self.name])
+    hilo_group_summaries_current.clear()
+    hilo_group_summaries_valid.clear()
 
 
 # properties
 # hint: enum_items = [(id, name, desc, icon, number), ... ]
-lowpolymeshsuffix_prop = bpy.props.StringProperty(name="Low Poly Suffix", description="Contains the low poly mesh name suffix, which declares a mesh as a `lowpoly` mesh", default="_low")
-highpolymeshsuffix_prop = bpy.props.StringProperty(name="High Poly Suffix", description="Contains the high poly mesh name suffix, which declares a mesh as a `highpoly mesh`", default="_high")
+lowpolymeshsuffix_prop = bpy.props.StringProperty(name="Low Poly Suffix", description="Contains the low poly mesh name suffix, which declares a mesh as a `lowpoly` mesh", default="_low", update=hilo_scene_settings_update)
+highpolymeshsuffix_prop = bpy.props.StringProperty(name="High Poly Suffix", description="Contains the high poly mesh name suffix, which declares a mesh as a `highpoly mesh`", default="_high", update=hilo_scene_settings_update)
 groupdetectionmode_enum = [("mesh-group-by-name", "Mesh-Group-by-name", "Use `Group Name Pattern` and object names to detect model features."),
-                           ("mesh-group-by-property", "Mesh-Group-by-property", "Use hilo's object properties `Mesh Type` and `Mesh Group` to detect model features.")]
-groupdetectionmode_prop = bpy.props.EnumProperty(name="Mesh Group Detection", items=groupdetectionmode_enum, description="Select a strategy to detect model features (=Blender Objects) which are joined together into a single mesh when final mesh operators are applied.", default='mesh-group-by-name')
-groupnamepattern_prop = bpy.props.StringProperty(name="Group Name Pattern", description="Object Naming Pattern for `Detect Mesh-Group-by-object-name`-feature", default="$group$res.*")
-helpernamepattern_prop = bpy.props.StringProperty(name="Helper Object Name Pattern", description="Helper Object Naming Pattern for `Detect Mesh-Group-by-object-name`-feature", default="$group:*")
+                           ("mesh-group-by-property", "Mesh-Group-by-property", "Use hilo's object properties `Mesh Type` and `Mesh Group` to detect model features."),
+                           ("mesh-group-by-group", "Mesh-Group-by-group", "Use Blender groups `<group><Low Poly Suffix>`, `<group><High Poly Suffix>`, `<group>_cage` and `<group>_origin` to detect model features. Objects outside these groups are not visited, group members are used even if they aren't linked to the scene.")]
+groupdetectionmode_prop = bpy.props.EnumProperty(name="Mesh Group Detection", items=groupdetectionmode_enum, description="Select a strategy to detect model features (=Blender Objects) which are joined together into a single mesh when final mesh operators are applied.", default='mesh-group-by-name', update=hilo_scene_settings_update)
+groupnamepattern_prop = bpy.props.StringProperty(name="Group Name Pattern", description="Object Naming Pattern for `Detect Mesh-Group-by-object-name`-feature", default="$group$res.*", update=hilo_scene_settings_update)
+helpernamepattern_prop = bpy.props.StringProperty(name="Helper Object Name Pattern", description="Helper Object Naming Pattern for `Detect Mesh-Group-by-object-name`-feature", default="$group:*", update=hilo_scene_settings_update)
 outputformat_enum = [("fbx", "Export as .fbx", "Export models in .fbx Format (FBX)"),
-                     ("obj", "Export as .obj", "Export models in .obj Format (Wavefront)")]
+                     ("obj", "Export as .obj", "Export models in .obj Format (Wavefront)"),
+                     ("glb", "Export as .glb", "Export models in binary .glb Format (glTF 2.0)")]
 outputformat_prop = bpy.props.EnumProperty(name="Output Format", items=outputformat_enum, description="Selected output format for export operations")
 outputpath_prop = bpy.props.StringProperty(name="Output Directory", description="Stores the output directory path used for export", default="//")
 lowpolyfilename_prop = bpy.props.StringProperty(name="Lowpoly Filename", description="Lowpoly model filename", default="mymodel_low")
 highpolyfilename_prop = bpy.props.StringProperty(name="Highpoly Filename", description="Highpoly model filename", default="mymodel_high")
 cagefilename_prop = bpy.props.StringProperty(name="Cage Filename (if any)", description="Cage model filename. A cage file is only created if there are any cage objects defined.", default="mymodel_cage")
+autodecimate_enum = [("none", "None", "Groups without lowpoly meshes get an empty lowpoly mesh"),
+                     ("ratio", "Ratio", "Groups without lowpoly meshes get a lowpoly mesh decimated from the highpoly mesh by `Decimate Ratio`"),
+                     ("triangles", "Triangle Budget", "Groups without lowpoly meshes get a lowpoly mesh decimated from the highpoly mesh to `Triangle Budget` triangles")]
+autodecimate_prop = bpy.props.EnumProperty(name="Auto Decimate", items=autodecimate_enum, description="Generate lowpoly meshes of groups which only have highpoly meshes", default="none")
+decimateratio_prop = bpy.props.FloatProperty(name="Decimate Ratio", description="Ratio of highpoly triangles kept in generated lowpoly meshes", default=0.1, min=0.0, max=1.0)
+decimatetriangles_prop = bpy.props.IntProperty(name="Triangle Budget", description="Maximum number of triangles of generated lowpoly meshes", default=1000, min=1)
+lodcount_prop = bpy.props.IntProperty(name="LOD Count", description="Number of LOD meshes (`<lowpoly>_LOD1`, `<lowpoly>_LOD2`, ...) decimated from each final lowpoly mesh", default=0, min=0)
+lodratio_prop = bpy.props.FloatProperty(name="LOD Ratio", description="Ratio of triangles each LOD keeps from the previous LOD", default=0.5, min=0.0, max=1.0)
+incrementalrefresh_prop = bpy.props.BoolProperty(name="Incremental Refresh", description="Only rebuild final meshes of mesh groups whose source objects have changed since the last build", default=False)
+workercount_prop = bpy.props.IntProperty(name="Worker Processes", description="Number of background Blender processes used by `Refresh Final Meshes (Parallel)`. 0 uses one process per CPU core", default=0, min=0)
+workerlogpath_prop = bpy.props.StringProperty(name="Worker Log Directory", description="Directory for the log files of background worker processes", default="//hilo_logs/", subtype='DIR_PATH')
+profile_prop = bpy.props.BoolProperty(name="Profile", description="Record time, memory growth and vertex/face counts of each mesh generation and export phase", default=False)
+profilepath_prop = bpy.props.StringProperty(name="Profile File", description="Write recorded profiles to this .json or .csv file. Leave empty to report them only", default="", subtype='FILE_PATH')
+profilecprofile_prop = bpy.props.BoolProperty(name="cProfile", description="Also dump cProfile statistics next to the profile file (.prof)", default=False)
+exportmode_enum = [("merged", "Merged", "Export all mesh groups into one lowpoly, highpoly and cage file"),
+                   ("per-group", "Per Group", "Export one lowpoly, highpoly and cage file per mesh group, named by the filename template, and an index file")]
+exportmode_prop = bpy.props.EnumProperty(name="Export Mode", items=exportmode_enum, description="Select how final meshes are split into export files", default="merged")
+exportfilenametemplate_prop = bpy.props.StringProperty(name="Filename Template", description="File name of per-group export files. `$group` is replaced by the group name, `$role` by lowpoly/highpoly/cage/lod1/... and `$suffix` by the final mesh suffix. Needs `$group` and `$role` or `$suffix`", default="$group$suffix")
+exportskipunchanged_prop = bpy.props.BoolProperty(name="Skip Unchanged Files", description="Don't rewrite export files whose meshes and export settings are unchanged since the last export, see `hilo_manifest.json` in the output directory", default=True)
+exportthreads_prop = bpy.props.IntProperty(name="Export Threads", description="Number of threads writing .obj/.glb files concurrently. 0 uses two threads per CPU core, 1 writes files one after another", default=0, min=0)
+autocage_prop = bpy.props.BoolProperty(name="Auto Cage", description="Generate a cage for groups without a cage helper by inflating the final lowpoly mesh along its vertex normals until it encloses the highpoly mesh (within `Coverage Distance`)", default=False)
+cagemargin_prop = bpy.props.FloatProperty(name="Cage Margin", description="Distance added to the measured lowpoly/highpoly distance of generated cages", default=0.01, min=0.0)
+bakepath_prop = bpy.props.StringProperty(name="Bake Directory", description="Directory for baked maps (`<lowpoly>_normal.png`, `<lowpoly>_ao.png`)", default="//hilo_bake/", subtype='DIR_PATH')
+bakenormal_prop = bpy.props.BoolProperty(name="Normal Map", description="Bake a tangent space normal map from each final highpoly mesh onto its final lowpoly mesh", default=True)
+bakeao_prop = bpy.props.BoolProperty(name="AO Map", description="Bake an ambient occlusion map from each final highpoly mesh onto its final lowpoly mesh", default=True)
+bakesize_prop = bpy.props.IntProperty(name="Bake Size", description="Width and height of baked maps in pixels", default=1024, min=1)
+bakesamples_prop = bpy.props.IntProperty(name="Bake Samples", description="Cycles samples per pixel of baked maps", default=64, min=1)
+bakemargin_prop = bpy.props.IntProperty(name="Bake Margin", description="Pixels baked maps are extended beyond the uv islands", default=16, min=0)
+bakeextrusion_prop = bpy.props.FloatProperty(name="Bake Extrusion", description="Distance rays are cast from the lowpoly mesh of groups without a cage", default=0.05, min=0.0)
+baketilesize_prop = bpy.props.IntProperty(name="Bake Tile Size", description="Cycles tile width and height used by bake workers", default=64, min=8)
+bakethreads_prop = bpy.props.IntProperty(name="Bake Threads", description="Cycles threads per bake worker process. 0 splits the CPU cores between the workers (see `Worker Processes`)", default=0, min=0)
+bakeskipunchanged_prop = bpy.props.BoolProperty(name="Skip Unchanged Bakes", description="Don't bake groups whose final meshes and bake settings are unchanged since their maps were baked, see `hilo_bake_manifest.json` in the bake directory", default=True)
+coveragedistance_prop = bpy.props.FloatProperty(name="Coverage Distance", description="Maximum distance between lowpoly and highpoly surfaces searched by `Analyze Coverage`. Lowpoly vertices without highpoly surface within this distance are reported as misses", default=1.0, min=0.0)
+datablockdiagnostics_prop = bpy.props.BoolProperty(name="Datablock Diagnostics", description="Report datablock counts and mesh data size before and after each final mesh regeneration", default=False)
+memorybudget_prop = bpy.props.IntProperty(name="Memory Budget", description="When the process uses more memory (in megabytes) while joining source meshes, orphaned mesh data created by the build is purged and garbage is collected. 0 disables the budget", default=0, min=0)
+uvcache_prop = bpy.props.BoolProperty(name="UV Cache", description="Reuse auto-unwrap uv layouts of final lowpoly meshes whose geometry hasn't changed", default=True)
+uvcachepath_prop = bpy.props.StringProperty(name="UV Cache Directory", description="Optional directory for cached uv layouts, e.g. `//hilo_uvcache/`. Leave empty to cache in memory only", default="", subtype='DIR_PATH')
+uvcacheentries_prop = bpy.props.IntProperty(name="UV Cache Entries", description="Number of uv layouts kept in memory", default=64, min=0)
+uvcachedisksize_prop = bpy.props.IntProperty(name="UV Cache Disk Size", description="Maximum size of the uv cache directory in megabytes. 0 is unlimited", default=256, min=0)
 meshtype_enum = [("ignore", "Ignore", "Ignore mesh in lowpoly and highpoly model"),
                  ("lowpoly", "Lowpoly Mesh", "Use mesh for lowpoly model"),
                  ("highpoly", "Highpoly Mesh", "Use mesh for highpoly model"),
                  ("origin", "Origin", "Use this object's location as origin for the model")]
-meshtype_prop = bpy.props.EnumProperty(name="Mesh Type", items=meshtype_enum, description="Contains the mesh type", default="ignore")
-meshgroup_prop = bpy.props.StringProperty(name="Mesh Group", description="Adds this object to the named Mesh Group when using `Detect Mesh-Group-by-property`-feature", default="")
+meshtype_prop = bpy.props.EnumProperty(name="Mesh Type", items=meshtype_enum, description="Contains the mesh type", default="ignore", update=hilo_object_settings_update)
+meshgroup_prop = bpy.props.StringProperty(name="Mesh Group", description="Adds this object to the named Mesh Group when using `Detect Mesh-Group-by-property`-feature", default="", update=hilo_object_settings_update)
 autounwrap_enum = [("none", "None", "No UV unwrap"),
                    ("smart-unwrap", "Smart Project", "Use `Smart Project` method for UV unwrap"),
                    ("cube-project", "Cube Project", "Use `Cube Projection` method for UV unwrap"),
@@ -69,6 +175,40 @@ bpy.types.Scene.hilo_outputpath = outputpath_prop
 bpy.types.Scene.hilo_lowpolyfilename = lowpolyfilename_prop
 bpy.types.Scene.hilo_highpolyfilename = highpolyfilename_prop
 bpy.types.Scene.hilo_cagefilename = cagefilename_prop
+bpy.types.Scene.hilo_autodecimate = autodecimate_prop
+bpy.types.Scene.hilo_decimateratio = decimateratio_prop
+bpy.types.Scene.hilo_decimatetriangles = decimatetriangles_prop
+bpy.types.Scene.hilo_lodcount = lodcount_prop
+bpy.types.Scene.hilo_lodratio = lodratio_prop
+bpy.types.Scene.hilo_incrementalrefresh = incrementalrefresh_prop
+bpy.types.Scene.hilo_workercount = workercount_prop
+bpy.types.Scene.hilo_workerlogpath = workerlogpath_prop
+bpy.types.Scene.hilo_profile = profile_prop
+bpy.types.Scene.hilo_profilepath = profilepath_prop
+bpy.types.Scene.hilo_profilecprofile = profilecprofile_prop
+bpy.types.Scene.hilo_exportmode = exportmode_prop
+bpy.types.Scene.hilo_exportfilenametemplate = exportfilenametemplate_prop
+bpy.types.Scene.hilo_exportskipunchanged = exportskipunchanged_prop
+bpy.types.Scene.hilo_exportthreads = exportthreads_prop
+bpy.types.Scene.hilo_memorybudget = memorybudget_prop
+bpy.types.Scene.hilo_datablockdiagnostics = datablockdiagnostics_prop
+bpy.types.Scene.hilo_coveragedistance = coveragedistance_prop
+bpy.types.Scene.hilo_autocage = autocage_prop
+bpy.types.Scene.hilo_cagemargin = cagemargin_prop
+bpy.types.Scene.hilo_bakepath = bakepath_prop
+bpy.types.Scene.hilo_bakenormal = bakenormal_prop
+bpy.types.Scene.hilo_bakeao = bakeao_prop
+bpy.types.Scene.hilo_bakesize = bakesize_prop
+bpy.types.Scene.hilo_bakesamples = bakesamples_prop
+bpy.types.Scene.hilo_bakemargin = bakemargin_prop
+bpy.types.Scene.hilo_bakeextrusion = bakeextrusion_prop
+bpy.types.Scene.hilo_baketilesize = baketilesize_prop
+bpy.types.Scene.hilo_bakethreads = bakethreads_prop
+bpy.types.Scene.hilo_bakeskipunchanged = bakeskipunchanged_prop
+bpy.types.Scene.hilo_uvcache = uvcache_prop
+bpy.types.Scene.hilo_uvcachepath = uvcachepath_prop
+bpy.types.Scene.hilo_uvcacheentries = uvcacheentries_prop
+bpy.types.Scene.hilo_uvcachedisksize = uvcachedisksize_prop
 
 # properties to store unwrap settings per-object
 # these are used by (hilo) unwrap operators to persist the unwrap settings
@@ -91,15 +231,34 @@ bpy.types.Object.hilo_meshgroup = meshgroup_prop # name of the mesh group this o
 
 
 class HiloMeshGroupDetectionStrategy:
+    # False if classifications depend on more than the object itself, see `HiloClassificationCache`
+    cacheable = True
     def __init__(self, objects, options):
         self.object_list = objects
         self.options = options
     def findGroupNames(self):
-        return []
+        result = []
+        for obj, group_name, role, is_group_source in self.classifyObjects():
+            if (is_group_source and not group_name in result):
+                result.append(group_name)
+        return result
     def findGroupObjects(self, group):
         return []
+    def classifyObject(self, obj):
+        # returns (group_name, role, is_group_source) or None
+        # role: 'lowpoly', 'highpoly', 'cage', 'origin' or 'helper'
+        # is_group_source: True if the object declares the group
+        return None
+    def classifyObjects(self):
+        # classify all objects in a single pass
+        for obj in self.object_list:
+            classification = self.classifyObject(obj)
+            if (not classification is None):
+                yield (obj,) + classification
     def isOrigin(self, obj):
         return False
+    def isCage(self, obj):
+        return False
     def isLowpolyMesh(self, obj):
         return False
     def isHighpolyMesh(self, obj):
@@ -112,70 +271,105 @@ class HiloDetectMeshGroupByNamePattern(HiloMeshGroupDetectionStrategy):
         self.helpername_pattern = options['helper_pattern']      # bpy.context.scene.hilo_helpernamepattern
         self.lowpolymeshsuffix = options['lowpolymesh_suffix']   # bpy.context.scene.hilo_lowpolymeshsuffix
         self.highpolymeshsuffix = options['highpolymesh_suffix'] # bpy.context.scene.hilo_highpolymeshsuffix
-        return super(HiloDetectMeshGroupByNamePattern, self).__init__(objects, options)
-    def groupPattern(self, group_name=None):
         if ((self.groupname_pattern is None) or (self.groupname_pattern == '')):
             self.groupname_pattern = '$group$res.*'
-        if (group_name is None):
-            group_repl = "(\w+)"
+        return super(HiloDetectMeshGroupByNamePattern, self).__init__(objects, options)
+    def cacheKey(self, kind, group_name, helper_name):
+        if (kind == 'group'):
+            pattern = self.groupname_pattern
         else:
-            group_repl = re.escape(group_name)
-        rep = {"$group": group_repl, 
-                "$res": "(%s|%s)" % (re.escape(self.lowpolymeshsuffix), re.escape(self.highpolymeshsuffix)),
-                ".": re.escape("."),
-                ":": re.escape(":"),
-                "_": re.escape("_"),
-                "*": ".*?"} # define desired replacements here
+            pattern = self.helpername_pattern
+        return (kind, pattern, self.lowpolymeshsuffix, self.highpolymeshsuffix, group_name, helper_name)
+    def expandPattern(self, pattern, rep):
         rep = dict((re.escape(k), v) for k, v in rep.items())
-        pattern = re.compile("|".join(rep.keys()))
-        return pattern.sub(lambda m: rep[re.escape(m.group(0))], self.groupname_pattern)
+        rep_pattern = re.compile("|".join(rep.keys()))
+        return rep_pattern.sub(lambda m: rep[re.escape(m.group(0))], pattern)
+    def compiledGroupPattern(self, group_name=None):
+        key = self.cacheKey('group', group_name, None)
+        compiled = hilo_pattern_cache.get(key)
+        if (compiled is None):
+            if (group_name is None):
+                group_repl = "(\w+)"
+            else:
+                group_repl = re.escape(group_name)
+            rep = {"$group": group_repl, 
+                    "$res": "(%s|%s)" % (re.escape(self.lowpolymeshsuffix), re.escape(self.highpolymeshsuffix)),
+                    ".": re.escape("."),
+                    ":": re.escape(":"),
+                    "_": re.escape("_"),
+                    "*": ".*?"} # define desired replacements here
+            compiled = re.compile(self.expandPattern(self.groupname_pattern, rep))
+            hilo_pattern_cache[key] = compiled
+        return compiled
+    def compiledHelperPattern(self, group_name=None, helper_name=None):
+        key = self.cacheKey('helper', group_name, helper_name)
+        compiled = hilo_pattern_cache.get(key)
+        if (compiled is None):
+            if (group_name is None):
+                group_repl = "(\w+)"
+            else:
+                group_repl = re.escape(group_name)
+            if (helper_name is None): 
+                helper_repl = ".*?"
+            else: 
+                helper_repl = re.escape(helper_name)
+            rep = {"$group": group_repl, 
+                    ".": re.escape("."),
+                    ":": re.escape(":"),
+                    "_": re.escape("_"),
+                    "*": helper_repl } # define desired replacements here
+            compiled = re.compile(self.expandPattern(self.helpername_pattern, rep))
+            hilo_pattern_cache[key] = compiled
+        return compiled
+    def groupPattern(self, group_name=None):
+        return self.compiledGroupPattern(group_name).pattern
     def helperPattern(self, group_name=None, helper_name=None):
-        if (group_name is None):
-            group_repl = "(\w+)"
-        else:
-            group_repl = re.escape(group_name)
-        if (helper_name is None): 
-            helper_repl = ".*?"
-        else: 
-            helper_repl = re.escape(helper_name)
-        rep = {"$group": group_repl, 
-                ".": re.escape("."),
-                ":": re.escape(":"),
-                "_": re.escape("_"),
-                "*": helper_repl } # define desired replacements here
-        rep = dict((re.escape(k), v) for k, v in rep.items())
-        pattern = re.compile("|".join(rep.keys()))
-        return pattern.sub(lambda m: rep[re.escape(m.group(0))], self.helpername_pattern)
-    def findGroupNames(self):
-        result = []
-        for obj in self.object_list:
-            m = re.search(self.groupPattern(), obj.name)
-            if (not m is None):
-                group_name = m.group(1)
-                if (not group_name in result):
-                    result.append(group_name)
-        return result 
+        return self.compiledHelperPattern(group_name, helper_name).pattern
+    def classifyObject(self, obj):
+        name = obj.name
+        # lowpoly and highpoly meshes declare the group
+        m = self.compiledGroupPattern().search(name)
+        if ((not m is None) and (m.re.groups > 0)):
+            if (name.find(self.lowpolymeshsuffix) > -1):
+                role = 'lowpoly'
+            elif (name.find(self.highpolymeshsuffix) > -1):
+                role = 'highpoly'
+            else:
+                role = 'helper'
+            return (m.group(1), role, True)
+        # helper objects join an existing group
+        m = self.compiledHelperPattern().search(name)
+        if ((not m is None) and (m.re.groups > 0)):
+            if (not self.compiledHelperPattern(helper_name="origin").search(name) is None):
+                role = 'origin'
+            elif (not self.compiledHelperPattern(helper_name="cage").search(name) is None):
+                role = 'cage'
+            else:
+                role = 'helper'
+            return (m.group(1), role, False)
+        return None
     def findGroupObjects(self, group):
         result = []
-        for i_obj in range(0, len(self.object_list)):
-            obj = self.object_list[i_obj]
-            is_pattern_match = not re.search(self.groupPattern(group_name=group), obj.name) is None
-            is_aux_match = not re.search(self.helperPattern(group_name=group), obj.name) is None
+        group_pattern = self.compiledGroupPattern(group_name=group)
+        helper_pattern = self.compiledHelperPattern(group_name=group)
+        for obj in self.object_list:
+            is_pattern_match = not group_pattern.search(obj.name) is None
+            is_aux_match = not helper_pattern.search(obj.name) is None
             if (is_pattern_match or is_aux_match):
                 result.append(obj)
         return result
     def isOrigin(self, obj):
-        is_match = not re.search(self.helperPattern(helper_name="origin"), obj.name) is None
+        is_match = not self.compiledHelperPattern(helper_name="origin").search(obj.name) is None
         return is_match
     def isCage(self, obj):
-        is_match = not re.search(self.helperPattern(helper_name="cage"), obj.name) is None
+        is_match = not self.compiledHelperPattern(helper_name="cage").search(obj.name) is None
         return is_match
     def isLowpolyMesh(self, obj):
-        is_pattern_match = not re.search(self.groupPattern(), obj.name) is None
+        is_pattern_match = not self.compiledGroupPattern().search(obj.name) is None
         is_res_match = obj.name.find(self.lowpolymeshsuffix) > -1
         return is_pattern_match and is_res_match
     def isHighpolyMesh(self, obj):
-        is_pattern_match = not re.search(self.groupPattern(), obj.name) is None
+        is_pattern_match = not self.compiledGroupPattern().search(obj.name) is None
         is_res_match = obj.name.find(self.highpolymeshsuffix) > -1
         return is_pattern_match and is_res_match
 
@@ -183,14 +377,15 @@ class HiloDetectMeshGroupByNamePattern(HiloMeshGroupDetectionStrategy):
 class HiloDetectMeshGroupByProperty(HiloMeshGroupDetectionStrategy):
     def __init__(self, objects, options):
         return super(HiloDetectMeshGroupByProperty, self).__init__(objects, options)
-    def findGroupNames(self):
-        result = []
-        for obj in self.object_list:
-            if ( (not obj.hilo_meshgroup is None) and (obj.hilo_meshgroup != '')):
-                group_name = obj.hilo_meshgroup
-                if (not group_name in result):
-                    result.append(group_name)
-        return result 
+    def classifyObject(self, obj):
+        group_name = obj.hilo_meshgroup
+        if ((group_name is None) or (group_name == '')):
+            return None
+        if (obj.hilo_meshtype in ('lowpoly', 'highpoly', 'origin')):
+            role = obj.hilo_meshtype
+        else:
+            role = 'helper'
+        return (group_name, role, True)
     def findGroupObjects(self, group):
         result = []
         for i_obj in range(0, len(self.object_list)):
@@ -207,15 +402,172 @@ class HiloDetectMeshGroupByProperty(HiloMeshGroupDetectionStrategy):
         return obj.hilo_meshtype == 'highpoly'
 
 
+def hilo_role_groups(blender_groups, lowpolymeshsuffix, highpolymeshsuffix):
+    # (blender group, mesh group name, role) of blender groups named `<group><suffix>`
+    suffixes = ((lowpolymeshsuffix, 'lowpoly'), (highpolymeshsuffix, 'highpoly'), ('_cage', 'cage'), ('_origin', 'origin'))
+    for blender_group in blender_groups:
+        name = blender_group.name
+        for suffix, role in suffixes:
+            if ((suffix != '') and (len(name) > len(suffix)) and name.endswith(suffix)):
+                yield (blender_group, name[:-len(suffix)], role)
+                break
+
+
+def hilo_grouped_objects(scene):
+    # objects of hilo's blender groups, scene objects outside these groups are not visited
+    # members don't need to be linked to `scene`, source meshes are evaluated with the scene passed to `to_mesh`
+    result = []
+    names = set()
+    for blender_group, group_name, role in hilo_role_groups(bpy.data.groups, scene.hilo_lowpolymeshsuffix, scene.hilo_highpolymeshsuffix):
+        for obj in blender_group.objects:
+            if (not obj.name in names):
+                names.add(obj.name)
+                result.append(obj)
+    return result
+
+
+class HiloDetectMeshGroupByGroup(HiloMeshGroupDetectionStrategy):
+    # membership changes with the blender groups, not with the objects
+    cacheable = False
+    def __init__(self, objects, options):
+        self.lowpolymeshsuffix = options['lowpolymesh_suffix']   # bpy.context.scene.hilo_lowpolymeshsuffix
+        self.highpolymeshsuffix = options['highpolymesh_suffix'] # bpy.context.scene.hilo_highpolymeshsuffix
+        # object name -> (group_name, role, is_group_source), the first group of an object wins
+        self.classifications = {}
+        for blender_group, group_name, role in hilo_role_groups(options['groups'], self.lowpolymeshsuffix, self.highpolymeshsuffix):
+            is_group_source = role in ('lowpoly', 'highpoly')
+            for obj in blender_group.objects:
+                if (not obj.name in self.classifications):
+                    self.classifications[obj.name] = (group_name, role, is_group_source)
+        return super(HiloDetectMeshGroupByGroup, self).__init__(objects, options)
+    def classifyObject(self, obj):
+        return self.classifications.get(obj.name)
+    def role(self, obj):
+        classification = self.classifications.get(obj.name)
+        if (classification is None):
+            return None
+        return classification[1]
+    def findGroupObjects(self, group):
+        result = []
+        for obj in self.object_list:
+            classification = self.classifications.get(obj.name)
+            if ((not classification is None) and (classification[0] == group)):
+                result.append(obj)
+        return result
+    def isOrigin(self, obj):
+        return self.role(obj) == 'origin'
+    def isCage(self, obj):
+        return self.role(obj) == 'cage'
+    def isLowpolyMesh(self, obj):
+        return self.role(obj) == 'lowpoly'
+    def isHighpolyMesh(self, obj):
+        return self.role(obj) == 'highpoly'
+
+
+class HiloClassificationCache:
+    def __init__(self):
+        self.settings = None
+        self.entries = {}  # object name -> (object pointer, classification)
+        self.object_count = None  # number of scene objects at the last sync
+        self.hits = 0
+        self.misses = 0
+    def invalidate(self, names=None):
+        if (names is None):
+            self.entries.clear()
+        else:
+            for name in names:
+                self.entries.pop(name, None)
+    def sync(self, scene):
+        # drop classifications of removed and renamed objects
+        # only when objects were added or removed, `is_updated` is also set while objects are moved,
+        # entries of renamed objects fail the pointer check in `classifyObjects` until then
+        object_count = len(scene.objects)
+        if ((len(self.entries) == 0) or (object_count == self.object_count)):
+            self.object_count = object_count
+            return
+        self.object_count = object_count
+        names = set(scene.objects.keys())
+        for name in [name for name in self.entries if not name in names]:
+            del self.entries[name]
+    def classifyObjects(self, objects, groupDetector, settings):
+        # settings changed: all classifications are outdated
+        if (settings != self.settings):
+            self.invalidate()
+            self.settings = settings
+        for obj in objects:
+            pointer = obj.as_pointer()
+            entry = self.entries.get(obj.name)
+            if ((not entry is None) and (entry[0] == pointer)):
+                self.hits += 1
+                classification = entry[1]
+            else:
+                self.misses += 1
+                classification = groupDetector.classifyObject(obj)
+                self.entries[obj.name] = (pointer, classification)
+            if (not classification is None):
+                yield (obj,) + classification
+    def statistics(self):
+        total = self.hits + self.misses
+        return {'entries':  len(self.entries),
+                'hits':     self.hits,
+                'misses':   self.misses,
+                'hit_rate': (float(self.hits) / total) if total > 0 else 0.0}
+
+
+def hilo_scene_mesh_groups(scene):
+    # find mesh groups in scene, reusing cached object classifications
+    if (not scene.name in hilo_classification_caches):
+        hilo_classification_caches[scene.name] = HiloClassificationCache()
+    if (scene.hilo_groupdetectionmode == 'mesh-group-by-group'):
+        # members are read from the blender groups
+        return HiloMeshGroups(hilo_grouped_objects(scene), cache=hilo_classification_caches[scene.name])
+    return HiloMeshGroups(scene.objects.values(), cache=hilo_classification_caches[scene.name])
+
+
+@bpy.app.handlers.persistent
+def hilo_scene_update_post(scene):
+    # objects were added, removed or renamed
+    if (bpy.data.objects.is_updated and (scene.name in hilo_classification_caches)):
+        hilo_classification_caches[scene.name].sync(scene)
+    # mesh group membership may have changed
+    if (hilo_group_summary_changed(scene)):
+        hilo_group_summaries_current.discard(scene.name)
+        hilo_group_summaries_valid.discard(scene.name)
+    # the overview panel is shown with an outdated overview
+    if ((scene.name in hilo_group_summaries_requested) and (scene == bpy.context.scene)):
+        hilo_group_summaries_requested.discard(scene.name)
+        hilo_update_group_summary(scene, check_dirty=False)
+        for area in getattr(bpy.context.screen, 'areas', []):
+            if (area.type == 'PROPERTIES'):
+                area.tag_redraw()
+
+
+@bpy.app.handlers.persistent
+def hilo_load_post(dummy):
+    # cached classifications belong to the previous file
+    hilo_classification_caches.clear()
+    hilo_group_summaries_current.clear()
+    hilo_group_summaries_valid.clear()
+    hilo_group_summaries_requested.clear()
+    hilo_group_summary_state.clear()
+
+
 class HiloMeshGroups:
-    def __init__(self, objects=[]):
+    roles = ('lowpoly', 'highpoly', 'cage', 'origin', 'helper')
+    def __init__(self, objects=[], cache=None):
         self.lowpolymeshsuffix = bpy.context.scene.hilo_lowpolymeshsuffix
         self.highpolymeshsuffix = bpy.context.scene.hilo_highpolymeshsuffix
         self.groupname_pattern = bpy.context.scene.hilo_groupnamepattern
         self.helpername_pattern = bpy.context.scene.hilo_helpernamepattern
+        self.autodecimate = bpy.context.scene.hilo_autodecimate
+        self.lodcount = bpy.context.scene.hilo_lodcount
         self.object_list = []
+        self.object_names = set()  # names of all grouped objects
         self.group_names = []
-        self.groups = {}
+        self.groups = {}           # group name -> role -> objects
+        self.members = {}          # group name -> objects, in scene order
+        self.pending = {}          # group name -> helper objects of a not (yet) declared group
+        self.cache = cache         # optional `HiloClassificationCache`
         self.addObjects(objects)
     def getMeshGroupDetector(self, more_objects):
         if (bpy.context.scene.hilo_groupdetectionmode == 'mesh-group-by-name'):
@@ -227,64 +579,86 @@ class HiloMeshGroups:
                 })
         elif (bpy.context.scene.hilo_groupdetectionmode == 'mesh-group-by-property'):
             return HiloDetectMeshGroupByProperty(more_objects, {})
+        elif (bpy.context.scene.hilo_groupdetectionmode == 'mesh-group-by-group'):
+            return HiloDetectMeshGroupByGroup(more_objects, {
+                'groups':              bpy.data.groups,
+                'lowpolymesh_suffix':  self.lowpolymeshsuffix,
+                'highpolymesh_suffix': self.highpolymeshsuffix
+                })
     def addObjects(self, more_objects):
         # get the group detector
         groupDetector = self.getMeshGroupDetector(more_objects)
-        # find group names and add them to the list of group names
-        new_groups = groupDetector.findGroupNames()
-        for group_name in new_groups:
-            if (not group_name in self.group_names):
-                self.group_names.append(group_name)
-        # find group members and add them to the object list and to the group list
-        for i_group in range(0, len(self.group_names)):
-            group_objects = groupDetector.findGroupObjects(self.group_names[i_group])
-            for obj in group_objects:
-                if (not obj in self.object_list):
-                    i_obj = len(self.object_list)
-                    self.object_list.append(obj)
-                    if (not i_group in self.groups):
-                        self.groups[i_group] = []
-                    self.groups[i_group].append(i_obj)
-    def getGroup(self, group, types=['ANY']):
+        # classify all objects in a single pass
+        if ((self.cache is None) or (not groupDetector.cacheable)):
+            classified = groupDetector.classifyObjects()
+        else:
+            classified = self.cache.classifyObjects(more_objects, groupDetector, self.settingsKey())
+        for obj, group_name, role, is_group_source in classified:
+            self.addClassifiedObject(obj, group_name, role, is_group_source)
+    def settingsKey(self):
+        return (bpy.context.scene.hilo_groupdetectionmode, self.groupname_pattern, self.helpername_pattern,
+                self.lowpolymeshsuffix, self.highpolymeshsuffix)
+    def addClassifiedObject(self, obj, group_name, role, is_group_source):
+        # skip already grouped objects and final meshes
+        if ((obj.name in self.object_names) or obj.get('hilo_final', False)):
+            return
+        # lowpoly and highpoly meshes must have mesh data
+        if ((role in ('lowpoly', 'highpoly')) and (obj.type != 'MESH')):
+            role = 'helper'
+        if (not group_name in self.groups):
+            if (not is_group_source):
+                # keep helper until its group is declared
+                self.pending.setdefault(group_name, []).append((obj, role))
+                return
+            self.group_names.append(group_name)
+            self.groups[group_name] = dict((r, []) for r in self.roles)
+            self.members[group_name] = []
+            for pending_obj, pending_role in self.pending.pop(group_name, []):
+                self.addMember(group_name, pending_obj, pending_role)
+        self.addMember(group_name, obj, role)
+    def addMember(self, group_name, obj, role):
+        self.object_names.add(obj.name)
+        self.object_list.append(obj)
+        self.members[group_name].append(obj)
+        self.groups[group_name][role].append(obj)
+    def groupName(self, group):
         if (type(group)==str):
-            group = self.group_names.index(group)
-        result = []
-        for i_obj in self.groups[group]:
-            if ('ANY' in types):
-                result.append(self.object_list[i_obj])
-            elif (self.object_list[i_obj].type in types):
-                result.append(self.object_list[i_obj])
-        return result
+            return group
+        return self.group_names[group]
+    def getGroup(self, group, types=['ANY']):
+        members = self.members[self.groupName(group)]
+        if ('ANY' in types):
+            return list(members)
+        return [obj for obj in members if obj.type in types]
+    def getRole(self, group, role):
+        return self.groups[self.groupName(group)][role]
     def getOrigin(self, group):
-        mg = self.getMeshGroupDetector([])
-        if (type(group)==str):
-            group = self.group_names.index(group)
-        for i_obj in self.groups[group]:
-            if (mg.isOrigin(self.object_list[i_obj])):
-                return self.object_list[i_obj].location
+        origins = self.getRole(group, 'origin')
+        if (len(origins) > 0):
+            return origins[0].location
         return bpy.context.scene.cursor_location
     def getCage(self, group):
-        mg = self.getMeshGroupDetector([])
-        if (type(group)==str):
-            group = self.group_names.index(group)
-        for i_obj in self.groups[group]:
-            if (mg.isCage(self.object_list[i_obj])):
-                return self.object_list[i_obj]
+        cages = self.getRole(group, 'cage')
+        if (len(cages) > 0):
+            return cages[0]
         return None
     def getLowpolyMeshes(self, group):
-        mg = self.getMeshGroupDetector([])
-        result = []
-        for group_obj in self.getGroup(group, ['MESH']):
-            if (mg.isLowpolyMesh(group_obj)):
-                result.append(group_obj)
-        return result
+        return list(self.getRole(group, 'lowpoly'))
     def getHighpolyMeshes(self, group):
-        mg = self.getMeshGroupDetector([])
-        result = []
-        for group_obj in self.getGroup(group, ['MESH']):
-            if (mg.isHighpolyMesh(group_obj)):
-                result.append(group_obj)
-        return result
+        return list(self.getRole(group, 'highpoly'))
+    def isDecimated(self, group):
+        # lowpoly mesh is generated from the highpoly mesh
+        return ((self.autodecimate != 'none') and (len(self.getLowpolyMeshes(group)) == 0) and (len(self.getHighpolyMeshes(group)) > 0))
+    def getLodRoles(self):
+        return ['lod%d' % (i_lod) for i_lod in range(1, self.lodcount + 1)]
+    def getFinalNames(self, group):
+        group_name = self.groupName(group)
+        final_names = {'lowpoly':  group_name + self.lowpolymeshsuffix,
+                       'highpoly': group_name + self.highpolymeshsuffix,
+                       'cage':     group_name + "_cage"}
+        for i_lod, role in enumerate(self.getLodRoles(), 1):
+            final_names[role] = final_names['lowpoly'] + '_LOD%d' % (i_lod)
+        return final_names
     def groupCount(self):
         return len(self.group_names)
 
@@ -462,6 +836,38 @@ class HiloMeshToolScenePanel(bpy.types.Panel):
         rowcol = row.column(align=True)
         rowcol.prop(context.scene, "hilo_autounwrapmode", text="")
 
+        # auto-decimate mode
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Lowpoly Auto-Decimate")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_autodecimate", text="")
+        if (context.scene.hilo_autodecimate == 'ratio'):
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="Decimate Ratio")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_decimateratio", text="")
+        elif (context.scene.hilo_autodecimate == 'triangles'):
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="Triangle Budget")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_decimatetriangles", text="")
+
+        # lod chain
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="LOD Count")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_lodcount", text="")
+        if (context.scene.hilo_lodcount > 0):
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="LOD Ratio")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_lodratio", text="")
+
         # output format
         row = layout.row()
         rowcol = row.column(align=True)
@@ -476,6 +882,20 @@ class HiloMeshToolScenePanel(bpy.types.Panel):
         rowcol = row.column(align=True)
         rowcol.prop(context.scene, "hilo_outputpath", text="")
 
+        # export mode
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Export Mode")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_exportmode", text="")
+        if (context.scene.hilo_exportmode == 'per-group'):
+            # per-group filename template
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="Filename Template")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_exportfilenametemplate", text="")
+
         # lowpoly filename
         row = layout.row()
         rowcol = row.column(align=True)
@@ -497,6 +917,172 @@ class HiloMeshToolScenePanel(bpy.types.Panel):
         rowcol = row.column(align=True)
         rowcol.prop(context.scene, "hilo_cagefilename", text="")
 
+        # skip unchanged files
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Skip Unchanged Files")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_exportskipunchanged", text="")
+
+        # export threads
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Export Threads")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_exportthreads", text="")
+
+        # incremental refresh
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Incremental Refresh")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_incrementalrefresh", text="")
+
+        # worker processes
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Worker Processes")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_workercount", text="")
+
+        # worker log directory
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Worker Log Directory")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_workerlogpath", text="")
+
+        # memory budget
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Memory Budget (MB)")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_memorybudget", text="")
+
+        # auto cage
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Auto Cage")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_autocage", text="")
+        if (context.scene.hilo_autocage):
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="Cage Margin")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_cagemargin", text="")
+
+        # coverage distance
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Coverage Distance")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_coveragedistance", text="")
+
+        # bake settings
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Directory")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakepath", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Normal Map")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakenormal", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="AO Map")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakeao", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Size")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakesize", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Samples")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakesamples", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Margin")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakemargin", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Extrusion")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakeextrusion", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Tile Size")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_baketilesize", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Bake Threads")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakethreads", text="")
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Skip Unchanged Bakes")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_bakeskipunchanged", text="")
+
+        # datablock diagnostics
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Datablock Diagnostics")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_datablockdiagnostics", text="")
+
+        # uv cache
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="UV Cache")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_uvcache", text="")
+        if (context.scene.hilo_uvcache):
+            # uv cache directory
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="UV Cache Directory")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_uvcachepath", text="")
+            # uv cache limits
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="UV Cache Entries")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_uvcacheentries", text="")
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="UV Cache Disk Size (MB)")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_uvcachedisksize", text="")
+
+        # profiling
+        row = layout.row()
+        rowcol = row.column(align=True)
+        rowcol.label(text="Profile")
+        rowcol = row.column(align=True)
+        rowcol.prop(context.scene, "hilo_profile", text="")
+        if (context.scene.hilo_profile):
+            # profile file
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="Profile File")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_profilepath", text="")
+            # cProfile dump
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text="cProfile Dump")
+            rowcol = row.column(align=True)
+            rowcol.prop(context.scene, "hilo_profilecprofile", text="")
+
         # create final mesh button
         row = layout.row()
         rowcol = row.column(align=True)
@@ -505,7 +1091,134 @@ class HiloMeshToolScenePanel(bpy.types.Panel):
         # export final mesh button
         rowcol = row.column(align=True)
         rowcol.operator("objects.hilorefreshfinalmesh", text="Regenerate Final Meshes")
+        rowcol.operator("objects.hiloparallelrefreshfinalmesh", text="Regenerate Final Meshes (Parallel)")
         rowcol.operator("objects.hiloexportfinalmesh", text="Export Final Meshes")
+        rowcol.operator("objects.hiloanalyzecoverage", text="Analyze Coverage")
+        rowcol.operator("objects.hilobakefinalmesh", text="Bake Final Meshes")
+        rowcol.operator("objects.hilopurgeorphanmeshes", text="Purge Orphan Meshes")
+
+
+class HiloGroupSummary(bpy.types.PropertyGroup):
+    # one row of the group overview, `name` is the mesh group name
+    lowpoly_count = bpy.props.IntProperty(name="Lowpoly Sources", default=0)
+    highpoly_count = bpy.props.IntProperty(name="Highpoly Sources", default=0)
+    cage_count = bpy.props.IntProperty(name="Cages", default=0)
+    origin_count = bpy.props.IntProperty(name="Origins", default=0)
+    helper_count = bpy.props.IntProperty(name="Helpers", default=0)
+    lowpoly_triangles = bpy.props.IntProperty(name="Lowpoly Triangles", description="Triangles of the final lowpoly mesh, -1 if it doesn't exist", default=-1)
+    highpoly_triangles = bpy.props.IntProperty(name="Highpoly Triangles", description="Triangles of the final highpoly mesh, -1 if it doesn't exist", default=-1)
+    dirty = bpy.props.BoolProperty(name="Dirty", description="Final meshes are missing or older than their sources", default=True)
+    build_time = bpy.props.StringProperty(name="Last Build", description="Time the final meshes were built", default="")
+
+
+def hilo_group_summary_changed(scene):
+    # True if mesh group membership may have changed: objects were added or removed, the active object was renamed
+    # or blender groups were edited, moving or editing objects doesn't change the overview
+    active = scene.objects.active
+    state = (len(bpy.data.objects),
+             active.as_pointer() if (not active is None) else None,
+             active.name if (not active is None) else None)
+    previous = hilo_group_summary_state.get(scene.name)
+    hilo_group_summary_state[scene.name] = state
+    if (bpy.data.groups.is_updated):
+        return True
+    if ((previous is None) or (previous[0] != state[0])):
+        return True
+    return ((previous[1] == state[1]) and (previous[2] != state[2]))
+
+
+def hilo_update_group_summary(scene, check_dirty=True):
+    # recompute the group overview of the scene, triangle counts and build times are stored on the finals
+    # the dirty state hashes all source meshes, without `check_dirty` it is kept from the last check
+    groups = hilo_scene_mesh_groups(scene)
+    builder = HiloFinalMeshBuilder(bpy.context, groups) if check_dirty else None
+    dirty = dict((item.name, item.dirty) for item in scene.hilo_groupsummary)
+    scene.hilo_groupsummary.clear()
+    for group_name in groups.group_names:
+        item = scene.hilo_groupsummary.add()
+        item.name = group_name
+        item.lowpoly_count = len(groups.getRole(group_name, 'lowpoly'))
+        item.highpoly_count = len(groups.getRole(group_name, 'highpoly'))
+        item.cage_count = len(groups.getRole(group_name, 'cage'))
+        item.origin_count = len(groups.getRole(group_name, 'origin'))
+        item.helper_count = len(groups.getRole(group_name, 'helper'))
+        final_names = groups.getFinalNames(group_name)
+        lowpoly_obj = bpy.data.objects.get(final_names['lowpoly'])
+        highpoly_obj = bpy.data.objects.get(final_names['highpoly'])
+        item.lowpoly_triangles = lowpoly_obj.get('hilo_triangles', -1) if (not lowpoly_obj is None) else -1
+        item.highpoly_triangles = highpoly_obj.get('hilo_triangles', -1) if (not highpoly_obj is None) else -1
+        item.dirty = builder.isDirty(group_name) if check_dirty else dirty.get(group_name, True)
+        build_time = lowpoly_obj.get('hilo_build_time') if (not lowpoly_obj is None) else None
+        item.build_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(build_time)) if (not build_time is None) else ""
+    scene.hilo_groupsummaryindex = min(scene.hilo_groupsummaryindex, max(0, len(scene.hilo_groupsummary) - 1))
+    hilo_group_summaries_valid.add(scene.name)
+    if (check_dirty):
+        hilo_group_summaries_current.add(scene.name)
+
+
+class HiloGroupSummaryList(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row()
+        row.label(text=item.name, icon='ERROR' if item.dirty else 'FILE_TICK')
+        row.label(text="%d low / %d high" % (item.lowpoly_count, item.highpoly_count))
+        row.label(text="%s / %s tris" % (item.lowpoly_triangles if (item.lowpoly_triangles >= 0) else "-",
+                                         item.highpoly_triangles if (item.highpoly_triangles >= 0) else "-"))
+
+
+class HiloGroupOverviewPanel(bpy.types.Panel):
+    bl_label = "High-/Lowpoly Groups"
+    bl_idname = "HiloGroupOverviewPanel"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+
+    def draw(self, context):
+        # draws the cached summary only, it is updated by `hilo_scene_update_post` and `HiloRefreshGroupSummary`
+        layout = self.layout
+        scene = context.scene
+        if (not scene.name in hilo_group_summaries_valid):
+            # recomputed on the next scene update
+            hilo_group_summaries_requested.add(scene.name)
+        row = layout.row()
+        rowcol = row.column(align=True)
+        if (scene.name in hilo_group_summaries_current):
+            rowcol.label(text="%d mesh groups" % (len(scene.hilo_groupsummary)))
+        else:
+            rowcol.label(text="Dirty state is outdated", icon='ERROR')
+        rowcol = row.column(align=True)
+        rowcol.operator("objects.hilorefreshgroupsummary", text="Refresh Overview")
+
+        layout.template_list("HiloGroupSummaryList", "", scene, "hilo_groupsummary", scene, "hilo_groupsummaryindex")
+
+        # details of the selected group
+        if ((scene.hilo_groupsummaryindex < 0) or (scene.hilo_groupsummaryindex >= len(scene.hilo_groupsummary))):
+            return
+        item = scene.hilo_groupsummary[scene.hilo_groupsummaryindex]
+        for label, value in (("Lowpoly Sources", item.lowpoly_count),
+                             ("Highpoly Sources", item.highpoly_count),
+                             ("Cages", item.cage_count),
+                             ("Origins", item.origin_count),
+                             ("Helpers", item.helper_count),
+                             ("Lowpoly Triangles", item.lowpoly_triangles if (item.lowpoly_triangles >= 0) else "-"),
+                             ("Highpoly Triangles", item.highpoly_triangles if (item.highpoly_triangles >= 0) else "-"),
+                             ("State", "Dirty" if item.dirty else "Clean"),
+                             ("Last Build", item.build_time if (item.build_time != "") else "-")):
+            row = layout.row()
+            rowcol = row.column(align=True)
+            rowcol.label(text=label)
+            rowcol = row.column(align=True)
+            rowcol.label(text=str(value))
+
+
+class HiloRefreshGroupSummary(bpy.types.Operator):
+    '''Recompute the group overview including the dirty state, which hashes all source meshes'''
+    bl_idname = "objects.hilorefreshgroupsummary"
+    bl_label = "Hilo - Refresh Group Overview"
+
+    def execute(self, context):
+        context.scene.update()
+        hilo_update_group_summary(context.scene)
+        return {'FINISHED'}
 
 
 class HiloCopyUnwrapSettingsToSelected(bpy.types.Operator)  :
@@ -544,55 +1257,65 @@ class HiloUnwrapSelectedObjects(bpy.types.Operator):
             bpy.ops.object.editmode_toggle()
         # unselect all objects
         bpy.ops.object.select_all(action='DESELECT')
-        # loop objects
+        # bucket objects by unwrap mode and parameters
+        buckets = []
+        bucket_objects = {}
         for selected_obj in selected_objects:
             # skip object if unwrap mode is 'None'
-            if (selected_obj.hilo_unwrap_mode == 'none'):
+            if ((selected_obj.hilo_unwrap_mode == 'none') or (selected_obj.type != 'MESH')):
                 self.report({'INFO'}, '  uv unwrap `%s`: skip' % (selected_obj.name))
                 continue
-            # switch object to edit mode
-            context.scene.objects.active = selected_obj
-            selected_obj.select = True
-            bpy.ops.object.editmode_toggle()
-            # select all vertices
-            bpy.ops.mesh.select_all(action='SELECT')
-            # unwrap current object
-            if (selected_obj.hilo_unwrap_mode == 'unwrap'):
-                op_result = bpy.ops.uv.unwrap(method='ANGLE_BASED',
-                                              fill_holes=selected_obj.hilo_unwrap_defaultFillHoles,
-                                              correct_aspect=selected_obj.hilo_unwrap_sharedCorrectAspect,
-                                              use_subsurf_data=selected_obj.hilo_unwrap_defaultUseSubsurf,
-                                              margin=selected_obj.hilo_unwrap_sharedMargin)
-                if (op_result == {'FINISHED'}):
-                    self.report({'INFO'}, '  uv unwrap `%s`: angle-based unwrap successful' % (selected_obj.name))
-                else:
-                    self.report({'ERROR'}, '  uv unwrap `%s`: angle-based unwrap failed' % (selected_obj.name))
-            elif (selected_obj.hilo_unwrap_mode == 'cube-project'):
-                op_result = bpy.ops.uv.cube_project(cube_size=selected_obj.hilo_unwrap_cubeScale, 
-                                                    correct_aspect=selected_obj.hilo_unwrap_sharedCorrectAspect, 
-                                                    clip_to_bounds=selected_obj.hilo_unwrap_cubeClipToBounds, 
-                                                    scale_to_bounds=selected_obj.hilo_unwrap_cubeScaleToBounds)
-                if (op_result == {'FINISHED'}):
-                    self.report({'INFO'}, '  uv unwrap `%s`: cube projection (scale=%.2f) successful' % (selected_obj.name, selected_obj.hilo_unwrap_cubeScale))
-                else:
-                    self.report({'ERROR'}, '  uv unwrap `%s`: cube projection (scale=%.2f) failed' % (selected_obj.name, selected_obj.hilo_unwrap_cubeScale))
-            elif (selected_obj.hilo_unwrap_mode == 'smart-project'):
-                op_result = bpy.ops.uv.smart_project(angle_limit=selected_obj.hilo_unwrap_smartAngleLimit, 
-                                                    island_margin=selected_obj.hilo_unwrap_sharedMargin, 
-                                                    user_area_weight=selected_obj.hilo_unwrap_smartUserAreaWeight, 
-                                                    useAspect=selected_obj.hilo_unwrap_sharedUseAspect)
-                if (op_result == {'FINISHED'}):
-                    self.report({'INFO'}, '  uv unwrap `%s`: smart unwrap (angle_limit=%.2f) successful' % (selected_obj.name, selected_obj.hilo_unwrap_smartAngleLimit))
+            parameters = hilo_unwrap_parameters(selected_obj)
+            key = (selected_obj.hilo_unwrap_mode, tuple(sorted(parameters.items())))
+            if (not key in bucket_objects):
+                buckets.append(key)
+                bucket_objects[key] = []
+            bucket_objects[key].append(selected_obj)
+        # unwrap each bucket, objects with identical mesh data reuse the uv layout,
+        # blender 2.7x edits one object at a time and a joined unwrap would pack all objects into one uv space
+        layouts = {}
+        unwrapped = {}
+        for key in buckets:
+            mode, parameters = key[0], dict(key[1])
+            description = hilo_unwrap_description(mode, parameters)
+            for selected_obj in bucket_objects[key]:
+                mesh = selected_obj.data
+                # mesh datablock was already unwrapped by another object
+                if ((mesh.as_pointer(), key) in unwrapped):
+                    self.report({'INFO'}, '  uv unwrap `%s`: %s shared with `%s`' % (selected_obj.name, description, unwrapped[(mesh.as_pointer(), key)].name))
+                    continue
+                # identical mesh data was already unwrapped
+                sha = hashlib.sha1()
+                hilo_topology_hash(sha, mesh)
+                layout_key = (sha.hexdigest(), key)
+                if (layout_key in layouts):
+                    hilo_copy_uv_layout(layouts[layout_key].data, mesh)
+                    unwrapped[(mesh.as_pointer(), key)] = selected_obj
+                    self.report({'INFO'}, '  uv unwrap `%s`: %s reused from `%s`' % (selected_obj.name, description, layouts[layout_key].name))
+                    continue
+                # unwrap the first object of each unique mesh, with its own edit mode session unless cube projected
+                if (hilo_unwrap_object(context, selected_obj, mode, parameters)):
+                    layouts[layout_key] = selected_obj
+                    unwrapped[(mesh.as_pointer(), key)] = selected_obj
+                    self.report({'INFO'}, '  uv unwrap `%s`: %s successful' % (selected_obj.name, description))
                 else:
-                    self.report({'ERROR'}, '  uv unwrap `%s`: smart unwrap (angle_limit=%.2f) failed' % (selected_obj.name, selected_obj.hilo_unwrap_smartAngleLimit))
-            # switch back to object mode
-            bpy.ops.object.editmode_toggle()
-            # deselect object
-            selected_obj.select = False
+                    self.report({'ERROR'}, '  uv unwrap `%s`: %s failed' % (selected_obj.name, description))
+        # report reuse
+        self.report({'INFO'}, 'uv unwrapped `%d` unique meshes in `%d` batches' % (len(layouts), len(buckets)))
         # return success
         return {'FINISHED'}
 
 
+class HiloPurgeOrphanMeshes(bpy.types.Operator):
+    """Remove mesh datablocks without users, e.g. left behind by earlier final mesh refreshes"""
+    bl_idname = "objects.hilopurgeorphanmeshes"
+    bl_label = "Hilo - Purge Orphan Meshes"
+
+    def execute(self, context):
+        self.report({'INFO'}, 'removed %d orphan meshes' % (hilo_purge_orphan_meshes()))
+        return {'FINISHED'}
+
+
 class HiloSetObjectOriginToCursor(bpy.types.Operator):
     """Set object origin to 3D cursor position"""
     bl_idname = "objects.hilosetobjectorigintocursor"
@@ -600,36 +1323,1234 @@ class HiloSetObjectOriginToCursor(bpy.types.Operator):
 
     def execute(self, context):
         # get active object
-        # get active object name
-        source_obj = context.scene.objects.active
-        source_obj_name = context.scene.objects.active.name
-        
-        # add a new mesh at cursor position
-        bpy.ops.object.add(type='MESH')
-        new_obj = context.scene.objects.active
-        new_mesh = new_obj.data
-
-        # remove it's vertices
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.delete(type='VERT')
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        # clone modifiers
-        bpy.ops.object.select_all(action='DESELECT')
-        source_obj.select = True 
-        new_obj.select = True
-        context.scene.objects.active = source_obj
-        bpy.ops.object.make_links_data(type='MODIFIERS')
-        
-        # join context object into new mesh
-        context.scene.objects.active = new_obj
-        bpy.ops.object.join()
+        obj = context.scene.objects.active
+        if ((obj is None) or (obj.type != 'MESH')):
+            self.report({'ERROR'}, 'active object is not a mesh object')
+            return {'CANCELLED'}
+        # ensure object mode
+        if (not context.edit_object is None):
+            bpy.ops.object.editmode_toggle()
+        # don't move the geometry of other objects sharing the mesh
+        if (obj.data.users > 1):
+            obj.data = obj.data.copy()
+        # move origin, geometry stays in place
+        hilo_set_origin(obj, context.scene.cursor_location)
+        return {'FINISHED'}
 
-        # rename new mesh
-        new_obj.name = source_obj_name
 
-        return {'FINISHED'}
+# per-object unwrap settings, see `HiloObjectUnwrapSettingsPanel`
+hilo_unwrap_settings = ('hilo_unwrap_mode', 'hilo_unwrap_sharedCorrectAspect', 'hilo_unwrap_sharedMargin',
+                        'hilo_unwrap_defaultFillHoles', 'hilo_unwrap_defaultUseSubsurf', 'hilo_unwrap_cubeScale',
+                        'hilo_unwrap_cubeClipToBounds', 'hilo_unwrap_cubeScaleToBounds', 'hilo_unwrap_smartAngleLimit',
+                        'hilo_unwrap_smartUserAreaWeight', 'hilo_unwrap_smartUseAspect')
+
+
+# uv operator of each unwrap mode
+hilo_unwrap_operators = {'unwrap': 'unwrap',
+                         'cube-project': 'cube_project',
+                         'smart-unwrap': 'smart_project'}
+
+
+def hilo_unwrap_parameters(obj):
+    # uv operator parameters of the object's unwrap settings
+    mode = obj.hilo_unwrap_mode
+    if (mode == 'unwrap'):
+        return {'method': 'ANGLE_BASED',
+                'fill_holes': obj.hilo_unwrap_defaultFillHoles,
+                'correct_aspect': obj.hilo_unwrap_sharedCorrectAspect,
+                'use_subsurf_data': obj.hilo_unwrap_defaultUseSubsurf,
+                'margin': obj.hilo_unwrap_sharedMargin}
+    elif (mode == 'cube-project'):
+        return {'cube_size': obj.hilo_unwrap_cubeScale,
+                'correct_aspect': obj.hilo_unwrap_sharedCorrectAspect,
+                'clip_to_bounds': obj.hilo_unwrap_cubeClipToBounds,
+                'scale_to_bounds': obj.hilo_unwrap_cubeScaleToBounds}
+    elif (mode == 'smart-unwrap'):
+        return {'angle_limit': obj.hilo_unwrap_smartAngleLimit,
+                'island_margin': obj.hilo_unwrap_sharedMargin,
+                'user_area_weight': obj.hilo_unwrap_smartUserAreaWeight,
+                'use_aspect': obj.hilo_unwrap_smartUseAspect}
+    return {}
+
+
+def hilo_unwrap_description(mode, parameters):
+    # human readable unwrap method for reports
+    if (mode == 'unwrap'):
+        return 'angle-based unwrap'
+    elif (mode == 'cube-project'):
+        return 'cube projection (scale=%.2f)' % (parameters['cube_size'])
+    elif (mode == 'smart-unwrap'):
+        return 'smart unwrap (angle_limit=%.2f)' % (parameters['angle_limit'])
+    return mode
+
+
+def hilo_unwrap_edit_mode(context, obj, mode, parameters):
+    # unwrap all faces of `obj` in its own edit mode session
+    context.scene.objects.active = obj
+    obj.select = True
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    op_result = getattr(bpy.ops.uv, hilo_unwrap_operators[mode])(**parameters)
+    bpy.ops.object.mode_set(mode='OBJECT')
+    obj.select = False
+    return (op_result == {'FINISHED'})
+
+
+def hilo_unwrap_object(context, obj, mode, parameters):
+    # unwrap all faces of `obj`, cube projection runs without edit mode
+    if (mode == 'cube-project'):
+        return hilo_cube_project(obj.data, cube_size=parameters['cube_size'],
+                                 clip_to_bounds=parameters['clip_to_bounds'],
+                                 scale_to_bounds=parameters['scale_to_bounds'])
+    return hilo_unwrap_edit_mode(context, obj, mode, parameters)
+
+
+def hilo_cube_project(mesh, cube_size=1.0, clip_to_bounds=False, scale_to_bounds=False, location=None):
+    # project each face along its dominant normal axis into the active uv layer,
+    # mirrors `bpy.ops.uv.cube_project` on all faces (centered on the bounding box)
+    co = hilo_foreach_get(mesh.vertices, 'co', np.float32, 3)
+    normal = hilo_foreach_get(mesh.polygons, 'normal', np.float32, 3)
+    loop_start = hilo_foreach_get(mesh.polygons, 'loop_start', np.int32)
+    loop_total = hilo_foreach_get(mesh.polygons, 'loop_total', np.int32)
+    loop_vertex = hilo_foreach_get(mesh.loops, 'vertex_index', np.int32)
+    if (mesh.uv_layers.active is None):
+        mesh.uv_textures.new()
+    if (len(loop_vertex) == 0):
+        return True
+    if (location is None):
+        location = (co.min(axis=0) + co.max(axis=0)) * 0.5
+    location = np.asarray(location, dtype=np.float32)
+    scale = (2.0 / cube_size) if (cube_size != 0.0) else 1.0
+    # dominant axis per face: z wins ties, then y (see `axis_dominant_v3`)
+    absolute = np.abs(normal)
+    z_dominant = (absolute[:, 2] >= absolute[:, 0]) & (absolute[:, 2] >= absolute[:, 1])
+    y_dominant = ~z_dominant & (absolute[:, 1] >= absolute[:, 0])
+    axis_a = np.where(z_dominant | y_dominant, 0, 1)
+    axis_b = np.where(z_dominant, 1, 2)
+    # project loop coordinates
+    loop_poly = np.repeat(np.arange(len(loop_total)), loop_total)
+    loop_co = co[loop_vertex] - location
+    uv = np.empty((len(loop_vertex), 2), dtype=np.float32)
+    uv[:, 0] = 0.5 + 0.5 * scale * loop_co[np.arange(len(loop_vertex)), axis_a[loop_poly]]
+    uv[:, 1] = 0.5 + 0.5 * scale * loop_co[np.arange(len(loop_vertex)), axis_b[loop_poly]]
+    # move each face next to the uv origin, based on its first loop
+    uv -= np.floor(uv[loop_start])[loop_poly]
+    # scale or clip to the uv bounds, scaling wins like in `uv_map_clip_correct`
+    if (scale_to_bounds):
+        uv_min = uv.min(axis=0)
+        uv_size = uv.max(axis=0) - uv_min
+        uv_size[uv_size == 0.0] = 1.0
+        uv = (uv - uv_min) / uv_size
+    elif (clip_to_bounds):
+        np.clip(uv, 0.0, 1.0, out=uv)
+    hilo_foreach_set(mesh.uv_layers.active.data, 'uv', uv.astype(np.float32))
+    mesh.update()
+    return True
+
+
+def hilo_copy_uv_layout(source_mesh, target_mesh):
+    # copy the active uv layer between meshes with identical topology
+    uv = hilo_foreach_get(source_mesh.uv_layers.active.data, 'uv', np.float32, 2)
+    if (target_mesh.uv_layers.active is None):
+        target_mesh.uv_textures.new()
+    hilo_foreach_set(target_mesh.uv_layers.active.data, 'uv', uv)
+    target_mesh.update()
+
+
+def hilo_rna_values(struct):
+    # collect the values of all plain properties of a bpy struct
+    values = []
+    for prop in struct.bl_rna.properties:
+        if ((prop.identifier == 'rna_type') or (prop.type == 'COLLECTION')):
+            continue
+        value = getattr(struct, prop.identifier, None)
+        if (prop.type == 'POINTER'):
+            value = getattr(value, 'name', None)
+        elif (getattr(prop, 'array_length', 0) > 0):
+            value = tuple(value)
+        values.append((prop.identifier, value))
+    return values
+
+
+def hilo_foreach_get(collection, attr, dtype, width=1):
+    # read an attribute of all collection items into a numpy array
+    buf = np.empty(len(collection) * width, dtype=dtype)
+    if (len(buf) > 0):
+        collection.foreach_get(attr, buf)
+    if (width > 1):
+        buf.shape = (-1, width)
+    return buf
+
+
+def hilo_foreach_set(collection, attr, values):
+    # write a numpy array to an attribute of all collection items
+    if (len(collection) > 0):
+        collection.foreach_set(attr, np.ascontiguousarray(values).ravel())
+
+
+def hilo_set_origin(obj, location):
+    # move the object origin to `location` (world space), geometry stays in place
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    offset = np.linalg.inv(matrix).dot(np.append(np.array(location, dtype=np.float64), 1.0))[:3]
+    co = hilo_foreach_get(obj.data.vertices, 'co', np.float32, 3)
+    hilo_foreach_set(obj.data.vertices, 'co', co - offset.astype(np.float32))
+    obj.data.update()
+    matrix_world = obj.matrix_world.copy()
+    matrix_world.translation = location
+    obj.matrix_world = matrix_world
+
+
+class HiloMeshBuffer:
+    def __init__(self):
+        self.co = np.empty((0, 3), dtype=np.float32)
+        self.edge_vertices = np.empty((0, 2), dtype=np.int32)
+        self.edge_seam = np.empty(0, dtype=np.bool_)
+        self.edge_sharp = np.empty(0, dtype=np.bool_)
+        self.loop_vertex = np.empty(0, dtype=np.int32)
+        self.loop_edge = np.empty(0, dtype=np.int32)
+        self.loop_normal = None     # custom split normals, if any
+        self.poly_loop_start = np.empty(0, dtype=np.int32)
+        self.poly_loop_total = np.empty(0, dtype=np.int32)
+        self.poly_material = np.empty(0, dtype=np.int32)
+        self.poly_smooth = np.empty(0, dtype=np.bool_)
+        self.uv_layers = []         # [(name, uv coordinates per loop), ...]
+        self.vertex_colors = []     # [(name, color per loop), ...]
+        self.materials = []
+        self.auto_smooth = None     # auto smooth angle, if auto smooth is enabled
+    def vertexCount(self):
+        return len(self.co)
+    def loopCount(self):
+        return len(self.loop_vertex)
+    def polygonCount(self):
+        return len(self.poly_loop_start)
+    def readMesh(self, mesh, matrix=None):
+        # read mesh data in bulk, optionally transformed by `matrix`
+        self.co = hilo_foreach_get(mesh.vertices, 'co', np.float32, 3)
+        self.edge_vertices = hilo_foreach_get(mesh.edges, 'vertices', np.int32, 2)
+        self.edge_seam = hilo_foreach_get(mesh.edges, 'use_seam', np.bool_)
+        self.edge_sharp = hilo_foreach_get(mesh.edges, 'use_edge_sharp', np.bool_)
+        self.loop_vertex = hilo_foreach_get(mesh.loops, 'vertex_index', np.int32)
+        self.loop_edge = hilo_foreach_get(mesh.loops, 'edge_index', np.int32)
+        self.poly_loop_start = hilo_foreach_get(mesh.polygons, 'loop_start', np.int32)
+        self.poly_loop_total = hilo_foreach_get(mesh.polygons, 'loop_total', np.int32)
+        self.poly_material = hilo_foreach_get(mesh.polygons, 'material_index', np.int32)
+        self.poly_smooth = hilo_foreach_get(mesh.polygons, 'use_smooth', np.bool_)
+        self.loop_normal = None
+        if (getattr(mesh, 'has_custom_normals', False)):
+            mesh.calc_normals_split()
+            self.loop_normal = hilo_foreach_get(mesh.loops, 'normal', np.float32, 3)
+            mesh.free_normals_split()
+        self.uv_layers = []
+        for uv_layer in mesh.uv_layers:
+            self.uv_layers.append((uv_layer.name, hilo_foreach_get(uv_layer.data, 'uv', np.float32, 2)))
+        self.vertex_colors = []
+        for color_layer in mesh.vertex_colors:
+            width = len(color_layer.data[0].color) if (len(color_layer.data) > 0) else 3
+            self.vertex_colors.append((color_layer.name, hilo_foreach_get(color_layer.data, 'color', np.float32, width)))
+        self.materials = list(mesh.materials)
+        self.auto_smooth = mesh.auto_smooth_angle if mesh.use_auto_smooth else None
+        if (not matrix is None):
+            self.transform(matrix)
+        return self
+    def readObject(self, obj, scene):
+        # evaluate modifiers, read the result in world space and free the temporary mesh
+        mesh = obj.to_mesh(scene=scene, apply_modifiers=True, settings='PREVIEW')
+        try:
+            self.readMesh(mesh, obj.matrix_world)
+        finally:
+            bpy.data.meshes.remove(mesh)
+        return self
+    def translate(self, offset):
+        self.co -= np.array(offset, dtype=np.float32)
+    def transform(self, matrix):
+        m = np.array(matrix, dtype=np.float64)
+        self.co = (self.co.dot(m[:3, :3].T) + m[:3, 3]).astype(np.float32)
+        if (not self.loop_normal is None):
+            # normals are transformed by the inverse transpose
+            normals = self.loop_normal.dot(np.linalg.inv(m[:3, :3]))
+            self.loop_normal = hilo_normalize(normals).astype(np.float32)
+    def writeMesh(self, mesh):
+        # write buffers in bulk to an empty mesh
+        mesh.vertices.add(self.vertexCount())
+        mesh.edges.add(len(self.edge_vertices))
+        mesh.loops.add(self.loopCount())
+        mesh.polygons.add(self.polygonCount())
+        hilo_foreach_set(mesh.vertices, 'co', self.co)
+        hilo_foreach_set(mesh.edges, 'vertices', self.edge_vertices)
+        hilo_foreach_set(mesh.edges, 'use_seam', self.edge_seam)
+        hilo_foreach_set(mesh.edges, 'use_edge_sharp', self.edge_sharp)
+        hilo_foreach_set(mesh.loops, 'vertex_index', self.loop_vertex)
+        hilo_foreach_set(mesh.loops, 'edge_index', self.loop_edge)
+        hilo_foreach_set(mesh.polygons, 'loop_start', self.poly_loop_start)
+        hilo_foreach_set(mesh.polygons, 'loop_total', self.poly_loop_total)
+        hilo_foreach_set(mesh.polygons, 'material_index', self.poly_material)
+        hilo_foreach_set(mesh.polygons, 'use_smooth', self.poly_smooth)
+        for material in self.materials:
+            mesh.materials.append(material)
+        for name, uv in self.uv_layers:
+            uv_texture = mesh.uv_textures.new(name=name)
+            if (not uv_texture is None):
+                hilo_foreach_set(mesh.uv_layers[uv_texture.name].data, 'uv', uv)
+        for name, colors in self.vertex_colors:
+            color_layer = mesh.vertex_colors.new(name=name)
+            if (not color_layer is None):
+                hilo_foreach_set(color_layer.data, 'color', colors)
+        mesh.update()
+        if (not self.auto_smooth is None):
+            mesh.use_auto_smooth = True
+            mesh.auto_smooth_angle = self.auto_smooth
+        if (not self.loop_normal is None):
+            mesh.use_auto_smooth = True
+            mesh.normals_split_custom_set(self.loop_normal.tolist())
+        return mesh
+    def toMesh(self, name):
+        return self.writeMesh(bpy.data.meshes.new(name))
+
+
+class HiloArrayBuilder:
+    # numpy array that grows in place, capacity grows by half when full
+    def __init__(self, dtype, width=1):
+        self.width = width
+        self.data = np.empty(self.shape(0), dtype=dtype)
+        self.size = 0
+    def shape(self, count):
+        return (count, self.width) if (self.width > 1) else (count,)
+    def reserve(self, count):
+        if (count > len(self.data)):
+            data = np.empty(self.shape(max(count, len(self.data) + len(self.data) // 2)), dtype=self.data.dtype)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+    def widen(self, width):
+        # add zero columns, e.g. for rgba colors after rgb colors
+        if (width > self.width):
+            data = np.zeros((len(self.data), width), dtype=self.data.dtype)
+            data[:, :self.width] = self.data.reshape(len(self.data), self.width)
+            self.data = data
+            self.width = width
+    def append(self, values):
+        self.reserve(self.size + len(values))
+        if ((self.width > 1) and (values.shape[1] < self.width)):
+            self.data[self.size:self.size + len(values)] = 0
+            self.data[self.size:self.size + len(values), :values.shape[1]] = values
+        else:
+            self.data[self.size:self.size + len(values)] = values
+        self.size += len(values)
+    def pad(self, count):
+        # append `count` zero rows
+        self.reserve(self.size + count)
+        self.data[self.size:self.size + count] = 0
+        self.size += count
+    def array(self):
+        return self.data[:self.size]
+    def nbytes(self):
+        return self.data.nbytes
+
+
+class HiloMeshAccumulator:
+    # joins mesh buffers one at a time, so only the joined result and one source are held
+    def __init__(self):
+        self.co = HiloArrayBuilder(np.float32, 3)
+        self.edge_vertices = HiloArrayBuilder(np.int32, 2)
+        self.edge_seam = HiloArrayBuilder(np.bool_)
+        self.edge_sharp = HiloArrayBuilder(np.bool_)
+        self.loop_vertex = HiloArrayBuilder(np.int32)
+        self.loop_edge = HiloArrayBuilder(np.int32)
+        self.loop_normal = None     # created when the first source has custom normals
+        self.poly_loop_start = HiloArrayBuilder(np.int32)
+        self.poly_loop_total = HiloArrayBuilder(np.int32)
+        self.poly_material = HiloArrayBuilder(np.int32)
+        self.poly_smooth = HiloArrayBuilder(np.bool_)
+        self.uv_layers = collections.OrderedDict()      # name -> HiloArrayBuilder
+        self.vertex_colors = collections.OrderedDict()  # name -> HiloArrayBuilder
+        self.materials = []
+        self.has_materials = False
+        self.auto_smooth = None
+    def builders(self):
+        result = [self.co, self.edge_vertices, self.edge_seam, self.edge_sharp, self.loop_vertex, self.loop_edge,
+                  self.poly_loop_start, self.poly_loop_total, self.poly_material, self.poly_smooth]
+        if (not self.loop_normal is None):
+            result.append(self.loop_normal)
+        return result + list(self.uv_layers.values()) + list(self.vertex_colors.values())
+    def nbytes(self):
+        return sum([builder.nbytes() for builder in self.builders()])
+    def materialRemap(self, buf):
+        # result slot of each of the buffer's material slots
+        if (len(buf.materials) > 0) and (not self.has_materials):
+            # earlier sources without materials use an empty first slot
+            self.has_materials = True
+            if (self.poly_material.size > 0):
+                self.materials.append(None)
+        if (not self.has_materials):
+            return np.zeros(1, dtype=np.int32)
+        remap = []
+        for material in (buf.materials if (len(buf.materials) > 0) else [None]):
+            if (not material in self.materials):
+                self.materials.append(material)
+            remap.append(self.materials.index(material))
+        return np.array(remap, dtype=np.int32)
+    def appendLayers(self, layers, buf_layers, width, loop_offset, loop_count):
+        # per-loop layers by name, loops of sources without the layer are zero
+        for name, values in buf_layers:
+            if (not name in layers):
+                layers[name] = HiloArrayBuilder(np.float32, max(width, values.shape[1]))
+                layers[name].pad(loop_offset)
+            layers[name].widen(values.shape[1])
+            layers[name].append(values)
+        for name, builder in layers.items():
+            if (builder.size < loop_offset + loop_count):
+                builder.pad(loop_offset + loop_count - builder.size)
+    def append(self, buf):
+        vertex_offset = self.co.size
+        edge_offset = self.edge_vertices.size
+        loop_offset = self.loop_vertex.size
+        remap = self.materialRemap(buf)
+        # buffers without custom normals keep their shading
+        if ((not buf.loop_normal is None) and (self.loop_normal is None)):
+            self.loop_normal = HiloArrayBuilder(np.float32, 3)
+            if (loop_offset > 0):
+                self.loop_normal.append(hilo_loop_normals(self.toBuffer()))
+        if (not self.loop_normal is None):
+            self.loop_normal.append(buf.loop_normal if (not buf.loop_normal is None) else hilo_loop_normals(buf))
+        self.co.append(buf.co)
+        self.edge_vertices.append(buf.edge_vertices + vertex_offset)
+        self.edge_seam.append(buf.edge_seam)
+        self.edge_sharp.append(buf.edge_sharp)
+        self.loop_vertex.append(buf.loop_vertex + vertex_offset)
+        self.loop_edge.append(buf.loop_edge + edge_offset)
+        self.poly_loop_start.append(buf.poly_loop_start + loop_offset)
+        self.poly_loop_total.append(buf.poly_loop_total)
+        self.poly_material.append(remap[np.clip(buf.poly_material, 0, len(remap) - 1)])
+        self.poly_smooth.append(buf.poly_smooth)
+        self.appendLayers(self.uv_layers, buf.uv_layers, 2, loop_offset, buf.loopCount())
+        self.appendLayers(self.vertex_colors, buf.vertex_colors, 3, loop_offset, buf.loopCount())
+        if (self.auto_smooth is None):
+            self.auto_smooth = buf.auto_smooth
+    def toBuffer(self):
+        # mesh buffer viewing the joined arrays
+        result = HiloMeshBuffer()
+        result.co = self.co.array()
+        result.edge_vertices = self.edge_vertices.array()
+        result.edge_seam = self.edge_seam.array()
+        result.edge_sharp = self.edge_sharp.array()
+        result.loop_vertex = self.loop_vertex.array()
+        result.loop_edge = self.loop_edge.array()
+        result.loop_normal = self.loop_normal.array() if (not self.loop_normal is None) else None
+        result.poly_loop_start = self.poly_loop_start.array()
+        result.poly_loop_total = self.poly_loop_total.array()
+        result.poly_material = self.poly_material.array()
+        result.poly_smooth = self.poly_smooth.array()
+        result.uv_layers = [(name, builder.array()) for name, builder in self.uv_layers.items()]
+        result.vertex_colors = [(name, builder.array()) for name, builder in self.vertex_colors.items()]
+        result.materials = list(self.materials)
+        result.auto_smooth = self.auto_smooth
+        return result
+
+
+def hilo_decimate_mesh(scene, mesh, ratio, name):
+    # collapse-decimate `mesh` into a new mesh datablock, `mesh` stays unchanged
+    temp_obj = bpy.data.objects.new(name, mesh)
+    modifier = temp_obj.modifiers.new('hilo_decimate', 'DECIMATE')
+    modifier.decimate_type = 'COLLAPSE'
+    modifier.ratio = ratio
+    try:
+        result = temp_obj.to_mesh(scene=scene, apply_modifiers=True, settings='PREVIEW')
+    finally:
+        bpy.data.objects.remove(temp_obj)
+    result.name = name
+    return result
+
+
+def hilo_memory_usage():
+    # current resident set size of this process in bytes, None if unknown
+    try:
+        with open('/proc/self/statm') as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def hilo_reset_memory_peak():
+    # reset the peak resident set size of this process (linux 4.0+), returns False if not supported
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs_file:
+            clear_refs_file.write('5')
+        return True
+    except (IOError, OSError):
+        return False
+
+
+def hilo_memory_peak():
+    # peak resident set size of this process in bytes since the last reset, None if unknown
+    try:
+        with open('/proc/self/status') as status_file:
+            for line in status_file:
+                if (line.startswith('VmHWM:')):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def hilo_mesh_bytes(mesh):
+    # approximate size of blender's mesh arrays (MVert, MEdge, MLoop, MPoly, MLoopUV, MLoopCol)
+    return (len(mesh.vertices) * 20 + len(mesh.edges) * 12 + len(mesh.loops) * 8 + len(mesh.polygons) * 12 +
+            len(mesh.loops) * (len(mesh.uv_layers) * 12 + len(mesh.vertex_colors) * 4))
+
+
+# datablock collections tracked and reported by the diagnostics, users come before the datablocks they use
+hilo_datablock_collections = ('objects', 'meshes', 'materials', 'images')
+
+
+class HiloDatablockTracker:
+    # tracks the datablocks created during a regeneration or bake cycle (temporary objects, meshes, bake materials and images),
+    # purges the ones left without users and reports datablock counts before and after
+    def __init__(self):
+        self.before = self.snapshot()
+        self.pointers = dict((name, set([idb.as_pointer() for idb in getattr(bpy.data, name)])) for name in hilo_datablock_collections)
+    def snapshot(self):
+        counts = {}
+        for name in hilo_datablock_collections:
+            counts[name] = len(getattr(bpy.data, name))
+        counts['mesh_bytes'] = sum([hilo_mesh_bytes(mesh) for mesh in bpy.data.meshes])
+        return counts
+    def created(self, name):
+        # datablocks of collection `name` created during the cycle
+        return [idb for idb in getattr(bpy.data, name) if (not idb.as_pointer() in self.pointers[name])]
+    def purge(self):
+        # remove datablocks created during the cycle that ended up without users, returns the number of removed datablocks
+        # removing an object or material releases the datablocks it uses, so they are purged in the same pass
+        purged = 0
+        for name in hilo_datablock_collections:
+            orphans = [idb for idb in self.created(name) if (idb.users == 0)]
+            for idb in orphans:
+                getattr(bpy.data, name).remove(idb)
+            purged += len(orphans)
+        return purged
+    def finish(self, scene, report):
+        # report signature is the same as `bpy.types.Operator.report`
+        purged = self.purge()
+        if (not scene.hilo_datablockdiagnostics):
+            return
+        after = self.snapshot()
+        for name in hilo_datablock_collections:
+            report({'INFO'}, '  datablocks: %s %d -> %d (%+d)' % (name, self.before[name], after[name], after[name] - self.before[name]))
+        report({'INFO'}, '  datablocks: mesh data %.1f MB -> %.1f MB (%+.1f MB), purged %d orphaned datablocks' %
+                         (self.before['mesh_bytes'] / 1048576.0, after['mesh_bytes'] / 1048576.0,
+                          (after['mesh_bytes'] - self.before['mesh_bytes']) / 1048576.0, purged))
+
+
+# growth since the last flush, as a fraction of the memory budget, before flushing again
+hilo_memory_flush_margin = 0.25
+
+
+def hilo_purge_orphan_meshes():
+    # remove mesh datablocks without users, returns the number of removed meshes
+    orphans = [mesh for mesh in bpy.data.meshes if (mesh.users == 0)]
+    for mesh in orphans:
+        bpy.data.meshes.remove(mesh)
+    return len(orphans)
+
+
+def hilo_normalize(vectors):
+    lengths = np.sqrt((vectors * vectors).sum(axis=1))
+    lengths[lengths == 0.0] = 1.0
+    return vectors / lengths[:, np.newaxis]
+
+
+def hilo_polygon_normals(buf, normalize=True):
+    # newell's method, vectorized over all polygons
+    # unnormalized normals are weighted by polygon area
+    normals = np.zeros((buf.polygonCount(), 3), dtype=np.float64)
+    if (buf.loopCount() > 0):
+        poly_index = np.repeat(np.arange(buf.polygonCount()), buf.poly_loop_total)
+        loop_next = np.arange(buf.loopCount()) + 1
+        is_last = loop_next == np.repeat(buf.poly_loop_start + buf.poly_loop_total, buf.poly_loop_total)
+        loop_next[is_last] = np.repeat(buf.poly_loop_start, buf.poly_loop_total)[is_last]
+        co = buf.co[buf.loop_vertex].astype(np.float64)
+        co_next = buf.co[buf.loop_vertex[loop_next]].astype(np.float64)
+        np.add.at(normals, poly_index, np.cross(co, co_next))
+    if (normalize):
+        normals = hilo_normalize(normals)
+    return normals
+
+
+def hilo_vertex_normals(buf):
+    # area weighted average of the adjacent polygon normals
+    normals = np.zeros((buf.vertexCount(), 3), dtype=np.float64)
+    np.add.at(normals, buf.loop_vertex, np.repeat(hilo_polygon_normals(buf, normalize=False), buf.poly_loop_total, axis=0))
+    return hilo_normalize(normals)
+
+
+def hilo_loop_normals(buf):
+    # vertex normals on smooth polygons, polygon normals on flat polygons
+    poly_normals = np.repeat(hilo_polygon_normals(buf), buf.poly_loop_total, axis=0)
+    loop_smooth = np.repeat(buf.poly_smooth, buf.poly_loop_total)
+    normals = np.where(loop_smooth[:, np.newaxis], hilo_vertex_normals(buf)[buf.loop_vertex], poly_normals)
+    return normals.astype(np.float32)
+
+
+def hilo_mesh_statistics(mesh):
+    # vertex, polygon and triangle counts of a mesh
+    loop_total = hilo_foreach_get(mesh.polygons, 'loop_total', np.int32)
+    return {'vertices':  len(mesh.vertices),
+            'polygons':  len(loop_total),
+            'triangles': int((loop_total - 2).sum())}
+
+
+def hilo_object_bounds(obj):
+    # world space bounding box of a mesh object as ([min x, y, z], [max x, y, z]), None if empty
+    co = hilo_foreach_get(obj.data.vertices, 'co', np.float32, 3)
+    if (len(co) == 0):
+        return None
+    m = np.array(obj.matrix_world, dtype=np.float64)
+    co = co.dot(m[:3, :3].T) + m[:3, 3]
+    return (co.min(axis=0).tolist(), co.max(axis=0).tolist())
+
+
+def hilo_topology_hash(sha, mesh):
+    # add vertex positions, topology and seams to the hash
+    for collection, attr, width, dtype in ((mesh.vertices, 'co', 3, np.float32),
+                                           (mesh.edges, 'vertices', 2, np.int32),
+                                           (mesh.edges, 'use_seam', 1, np.bool_),
+                                           (mesh.loops, 'vertex_index', 1, np.int32),
+                                           (mesh.polygons, 'loop_total', 1, np.int32)):
+        sha.update(hilo_foreach_get(collection, attr, dtype, width).tobytes())
+
+
+def hilo_mesh_hash(sha, mesh):
+    # add vertex positions, topology, seams, materials and uv coordinates to the hash
+    hilo_topology_hash(sha, mesh)
+    for collection, attr, width, dtype in ((mesh.polygons, 'material_index', 1, np.int32),
+                                           (mesh.polygons, 'use_smooth', 1, np.bool_)):
+        sha.update(hilo_foreach_get(collection, attr, dtype, width).tobytes())
+    for uv_layer in mesh.uv_layers:
+        sha.update(uv_layer.name.encode('utf-8'))
+        sha.update(hilo_foreach_get(uv_layer.data, 'uv', np.float32, 2).tobytes())
+    sha.update(repr([getattr(mat, 'name', None) for mat in mesh.materials]).encode('utf-8'))
+
+
+def hilo_object_hash(sha, obj):
+    # add transform, mesh data, modifier stack and unwrap settings to the hash
+    sha.update(repr((obj.name, obj.type, [tuple(row) for row in obj.matrix_world])).encode('utf-8'))
+    if (obj.type == 'MESH'):
+        hilo_mesh_hash(sha, obj.data)
+    for modifier in obj.modifiers:
+        sha.update(repr(hilo_rna_values(modifier)).encode('utf-8'))
+    sha.update(repr([getattr(obj, key) for key in hilo_unwrap_settings]).encode('utf-8'))
+
+
+class HiloUVCache:
+    def __init__(self, directory='', max_entries=64, max_disk_size=256):
+        self.entries = collections.OrderedDict()  # key -> uv array, least recently used first
+        self.configure(directory, max_entries, max_disk_size)
+        self.resetStatistics()
+    def configure(self, directory, max_entries, max_disk_size):
+        self.directory = directory          # '' caches in memory only
+        self.max_entries = max_entries
+        self.max_disk_size = max_disk_size  # megabytes, 0 is unlimited
+        self.trim()
+    def resetStatistics(self):
+        self.hits = 0
+        self.misses = 0
+    def key(self, mesh, unwrap_mode, parameters=None):
+        # content hash of geometry, topology, seams and unwrap settings
+        sha = hashlib.sha1()
+        sha.update(repr((unwrap_mode, parameters)).encode('utf-8'))
+        hilo_topology_hash(sha, mesh)
+        return sha.hexdigest()
+    def filepath(self, key):
+        return os.path.join(self.directory, key + '.npy')
+    def get(self, key):
+        # cached uv array or None
+        uv = self.entries.get(key)
+        if (not uv is None):
+            self.entries.move_to_end(key)
+        elif ((self.directory != '') and os.path.isfile(self.filepath(key))):
+            try:
+                uv = np.load(self.filepath(key))
+                os.utime(self.filepath(key), None)
+            except (IOError, OSError, ValueError):
+                uv = None
+            if (not uv is None):
+                self.remember(key, uv)
+        if (uv is None):
+            self.misses += 1
+        else:
+            self.hits += 1
+        return uv
+    def put(self, key, uv):
+        self.remember(key, uv)
+        if (self.directory == ''):
+            return
+        if (not os.path.isdir(self.directory)):
+            os.makedirs(self.directory)
+        # write to a temporary file first, other processes may read the cache
+        fd, temp_filepath = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        with os.fdopen(fd, 'wb') as cache_file:
+            np.save(cache_file, uv)
+        os.replace(temp_filepath, self.filepath(key))
+        self.evictFiles()
+    def remember(self, key, uv):
+        self.entries[key] = uv
+        self.entries.move_to_end(key)
+        self.trim()
+    def trim(self):
+        # drop least recently used entries beyond the memory limit
+        while (len(self.entries) > self.max_entries):
+            self.entries.popitem(last=False)
+    def evictFiles(self):
+        # delete least recently used cache files beyond the disk limit
+        if ((self.max_disk_size <= 0) or (not os.path.isdir(self.directory))):
+            return
+        files = []
+        for filename in os.listdir(self.directory):
+            if (filename.endswith('.npy')):
+                stat = os.stat(os.path.join(self.directory, filename))
+                files.append((stat.st_mtime, stat.st_size, os.path.join(self.directory, filename)))
+        files.sort()
+        total_size = sum(size for mtime, size, filepath in files)
+        for mtime, size, filepath in files:
+            if (total_size <= self.max_disk_size * 1024 * 1024):
+                break
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            total_size -= size
+    def statistics(self):
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (float(self.hits) / lookups) if (lookups > 0) else 0.0,
+                'entries': len(self.entries)}
+    def report(self, report):
+        # report hit rate, same signature as `bpy.types.Operator.report`
+        stats = self.statistics()
+        if (stats['hits'] + stats['misses'] > 0):
+            report({'INFO'}, 'uv cache: %d hits, %d misses (%.0f%% hit rate), %d layouts in memory' % (stats['hits'], stats['misses'], stats['hit_rate'] * 100.0, stats['entries']))
+
+
+def hilo_scene_uv_cache(scene, directory=None):
+    # uv layout cache configured by the scene's settings, None if disabled
+    if (not scene.hilo_uvcache):
+        return None
+    if (directory is None):
+        directory = scene.hilo_uvcachepath
+        # relative paths need a saved .blend file, cache in memory until then
+        if (directory.startswith('//') and (bpy.data.filepath == '')):
+            directory = ''
+        elif (directory != ''):
+            directory = bpy.path.abspath(directory)
+    if (not scene.name in hilo_uv_caches):
+        hilo_uv_caches[scene.name] = HiloUVCache()
+    cache = hilo_uv_caches[scene.name]
+    cache.configure(directory, scene.hilo_uvcacheentries, scene.hilo_uvcachedisksize)
+    cache.resetStatistics()
+    return cache
+
+
+class HiloProfiler:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.records = []  # [{'group', 'phase', 'time', 'memory_before', 'memory_after', 'memory_delta', 'memory_peak', 'vertices', 'polygons', ...}, ...]
+        self.profile = None
+        self.peaks = []  # peak memory so far of each open phase, innermost last
+    def start(self, use_cprofile=False):
+        if (self.enabled and use_cprofile):
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+    def memoryUsage(self):
+        # current resident set size of this process in bytes, None if unknown
+        # without /proc the peak resident set size is used, phases then show how much they raised the peak
+        usage = hilo_memory_usage()
+        if ((usage is None) and (not resource is None)):
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            usage = peak if (sys.platform == 'darwin') else peak * 1024
+        return usage
+    @contextlib.contextmanager
+    def phase(self, group, phase, **fields):
+        # time a pipeline phase, the caller may add vertex and polygon counts to the record
+        record = {'group': group, 'phase': phase, 'vertices': None, 'polygons': None}
+        record.update(fields)
+        memory_before = self.memoryUsage() if self.enabled else None
+        if (self.enabled):
+            self.startPeak(memory_before)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            if (self.enabled):
+                self.peaks.pop()
+            raise
+        if (self.enabled):
+            record['time'] = time.perf_counter() - start
+            memory_after = self.memoryUsage()
+            record['memory_before'] = memory_before
+            record['memory_after'] = memory_after
+            record['memory_delta'] = (memory_after - memory_before) if ((not memory_before is None) and (not memory_after is None)) else None
+            record['memory_peak'] = self.finishPeak()
+            self.records.append(record)
+    def startPeak(self, memory_before):
+        # open phases keep the peak reached so far before the kernel's peak is reset for the new phase
+        self.updatePeaks(hilo_memory_peak())
+        self.peaks.append(memory_before if hilo_reset_memory_peak() else None)
+    def finishPeak(self):
+        # peak resident set size during the innermost phase, None if the peak can't be reset
+        peak = self.peaks.pop()
+        if (not peak is None):
+            current = hilo_memory_peak()
+            peak = max(peak, current) if (not current is None) else None
+        self.updatePeaks(peak)
+        return peak
+    def updatePeaks(self, peak):
+        if (peak is None):
+            return
+        self.peaks = [max(open_peak, peak) if (not open_peak is None) else None for open_peak in self.peaks]
+    def totals(self):
+        # total time per phase
+        totals = {}
+        for record in self.records:
+            totals[record['phase']] = totals.get(record['phase'], 0.0) + record['time']
+        return totals
+    def groupTotals(self):
+        # total time per group
+        totals = {}
+        for record in self.records:
+            if (not record['group'] is None):
+                totals[record['group']] = totals.get(record['group'], 0.0) + record['time']
+        return totals
+    def write(self, filepath):
+        # .csv files get one row per record, anything else is written as JSON
+        if (filepath.lower().endswith('.csv')):
+            columns = ['group', 'phase', 'object', 'time', 'memory_before', 'memory_after', 'memory_delta', 'memory_peak', 'vertices', 'polygons']
+            with open(filepath, 'w', newline='') as profile_file:
+                writer = csv.DictWriter(profile_file, fieldnames=columns, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(self.records)
+        else:
+            with open(filepath, 'w') as profile_file:
+                json.dump({'records': self.records, 'totals': self.totals()}, profile_file, indent=2, sort_keys=True)
+    def finish(self, scene, report):
+        # report the slowest phases and groups and write the profile files
+        if (not self.enabled):
+            return
+        if (not self.profile is None):
+            self.profile.disable()
+        for phase, total in sorted(self.totals().items(), key=lambda item: -item[1]):
+            report({'INFO'}, '  profile: %s %.3fs' % (phase, total))
+        for group_name, total in sorted(self.groupTotals().items(), key=lambda item: -item[1])[:5]:
+            report({'INFO'}, '  profile: group `%s` %.3fs' % (group_name, total))
+        if (scene.hilo_profilepath != ''):
+            filepath = bpy.path.abspath(scene.hilo_profilepath)
+            self.write(filepath)
+            if (not self.profile is None):
+                self.profile.dump_stats(os.path.splitext(filepath)[0] + '.prof')
+
+
+def hilo_scene_profiler(scene):
+    # profiler configured by the scene's profiling settings
+    profiler = HiloProfiler(scene.hilo_profile)
+    profiler.start(scene.hilo_profilecprofile)
+    return profiler
+
+
+class HiloFinalMeshBuilder:
+    def __init__(self, context, groups, profiler=None, uv_cache=None, tracker=None):
+        self.context = context
+        self.groups = groups
+        self.profiler = profiler if (not profiler is None) else HiloProfiler()
+        self.uv_cache = uv_cache if (not uv_cache is None) else hilo_scene_uv_cache(context.scene)
+        # meshes created by the build, only these are purged when over the memory budget
+        self.tracker = tracker
+        # memory usage after the last flush, None before the first one
+        self.flush_usage = None
+    def finalNames(self, group):
+        return self.groups.getFinalNames(group)
+    def groupHash(self, group):
+        scene = self.context.scene
+        sha = hashlib.sha1()
+        sha.update(repr((scene.hilo_autounwrapmode, self.groups.lowpolymeshsuffix, self.groups.highpolymeshsuffix)).encode('utf-8'))
+        sha.update(repr((scene.hilo_autodecimate, scene.hilo_decimateratio, scene.hilo_decimatetriangles, scene.hilo_lodcount, scene.hilo_lodratio)).encode('utf-8'))
+        if (self.autoCage()):
+            sha.update(repr((scene.hilo_cagemargin, scene.hilo_coveragedistance)).encode('utf-8'))
+        for role in ('lowpoly', 'highpoly', 'cage', 'origin'):
+            for obj in self.groups.getRole(group, role):
+                sha.update(role.encode('utf-8'))
+                hilo_object_hash(sha, obj)
+        return sha.hexdigest()
+    def isDirty(self, group, group_hash=None):
+        if (group_hash is None):
+            group_hash = self.groupHash(group)
+        final_names = self.finalNames(group)
+        expected = ['lowpoly', 'highpoly'] + self.groups.getLodRoles()
+        if ((not self.groups.getCage(group) is None) or self.autoCage()):
+            expected.append('cage')
+        for role in expected:
+            final_obj = bpy.data.objects.get(final_names[role])
+            if ((final_obj is None) or (final_obj.get('hilo_source_hash') != group_hash)):
+                return True
+        return False
+    def dirtyGroups(self, incremental):
+        # returns [(group name, group hash), ...] of the groups to (re)build
+        dirty_groups = []
+        for group_name in self.groups.group_names:
+            group_hash = self.groupHash(group_name)
+            if ((not incremental) or self.isDirty(group_name, group_hash)):
+                dirty_groups.append((group_name, group_hash))
+        return dirty_groups
+    def rebuildGroups(self, dirty_groups):
+        # remove and rebuild final meshes, returns the build time per group
+        for group_name, group_hash in dirty_groups:
+            self.removeGroup(group_name)
+        build_times = {}
+        for group_name, group_hash in dirty_groups:
+            start = time.perf_counter()
+            self.buildGroup(group_name, group_hash)
+            build_times[group_name] = time.perf_counter() - start
+        return build_times
+    def finalStatistics(self, group):
+        # vertex, polygon and triangle counts of the group's final meshes
+        statistics = {}
+        for role, final_name in self.finalNames(group).items():
+            final_obj = bpy.data.objects.get(final_name)
+            if ((final_obj is None) or (final_obj.type != 'MESH')):
+                continue
+            statistics[role] = hilo_mesh_statistics(final_obj.data)
+        return statistics
+    def removeGroup(self, group):
+        # remove existing final meshes of the group
+        for final_name in self.finalNames(group).values():
+            final_obj = bpy.data.objects.get(final_name)
+            if (not final_obj is None):
+                mesh = final_obj.data if (final_obj.type == 'MESH') else None
+                if (final_obj.name in self.context.scene.objects):
+                    self.context.scene.objects.unlink(final_obj)
+                bpy.data.objects.remove(final_obj)
+                # the final mesh data is not shared, don't leave it behind as an orphan
+                if ((not mesh is None) and (mesh.users == 0)):
+                    bpy.data.meshes.remove(mesh)
+    def tagFinal(self, final_obj, group_hash):
+        final_obj['hilo_final'] = True
+        final_obj['hilo_build_time'] = time.time()
+        if (final_obj.type == 'MESH'):
+            final_obj['hilo_triangles'] = hilo_mesh_statistics(final_obj.data)['triangles']
+        hilo_group_summaries_valid.discard(self.context.scene.name)
+        if (not group_hash is None):
+            final_obj['hilo_source_hash'] = group_hash
+    def joinObjects(self, objects, name, origin, group=None):
+        # evaluate source objects one at a time and append them to the joined result,
+        # the temporary mesh of each source is freed before the next one is evaluated
+        accumulator = HiloMeshAccumulator()
+        for obj in objects:
+            with self.profiler.phase(group, 'to_mesh', object=obj.name) as record:
+                source = HiloMeshBuffer().readObject(obj, self.context.scene)
+                record['vertices'] = source.vertexCount()
+                record['polygons'] = source.polygonCount()
+            with self.profiler.phase(group, 'join', object=name, vertices=source.vertexCount(), polygons=source.polygonCount()):
+                accumulator.append(source)
+            source = None
+            self.checkMemoryBudget(accumulator, group)
+        buffer = accumulator.toBuffer()
+        # move geometry relative to the origin in a single pass
+        with self.profiler.phase(group, 'origin', object=name, vertices=buffer.vertexCount()):
+            buffer.translate(origin)
+        with self.profiler.phase(group, 'join', object=name, vertices=buffer.vertexCount(), polygons=buffer.polygonCount()):
+            result = bpy.data.objects.new(name, buffer.toMesh(name))
+            result.location = origin
+            self.context.scene.objects.link(result)
+        return result
+    def autoCage(self):
+        # cages are generated for groups without a cage helper
+        return (self.context.scene.hilo_autocage and (not BVHTree is None))
+    def generateCage(self, lowpoly_obj, highpoly_obj, name, group=None):
+        # inflate the lowpoly along its vertex normals by the distance to the highpoly surface plus margin
+        scene = self.context.scene
+        with self.profiler.phase(group, 'cage', object=name) as record:
+            # `matrix_world` of the new finals isn't updated until the next scene update,
+            # final objects have no parent so their `matrix_basis` is their world transform
+            matrix = lowpoly_obj.matrix_basis.copy()
+            buf = HiloMeshBuffer().readMesh(lowpoly_obj.data, matrix)
+            normals = hilo_vertex_normals(buf)
+            outward, inward = hilo_ray_distances(highpoly_obj, scene, buf.co, normals, scene.hilo_coveragedistance,
+                                                 highpoly_obj.matrix_basis)
+            offsets = np.nan_to_num(outward) + scene.hilo_cagemargin
+            buf.co = (buf.co + normals * offsets[:, np.newaxis]).astype(np.float32)
+            buf.transform(matrix.inverted())
+            result = bpy.data.objects.new(name, buf.toMesh(name))
+            result.matrix_basis = matrix
+            self.context.scene.objects.link(result)
+            record['vertices'] = buf.vertexCount()
+            record['polygons'] = buf.polygonCount()
+        return result
+    def decimateRatio(self, highpoly_obj):
+        # ratio of highpoly triangles kept in a generated lowpoly mesh
+        scene = self.context.scene
+        if (scene.hilo_autodecimate == 'triangles'):
+            triangles = hilo_mesh_statistics(highpoly_obj.data)['triangles']
+            return min(1.0, float(scene.hilo_decimatetriangles) / max(1, triangles))
+        return scene.hilo_decimateratio
+    def decimateObject(self, source_obj, name, ratio, group=None):
+        # new final object with a decimated copy of the source's mesh, at the source's transform,
+        # final objects have no parent and `matrix_world` of a new final isn't updated until the next scene update
+        with self.profiler.phase(group, 'decimate', object=name) as record:
+            mesh = hilo_decimate_mesh(self.context.scene, source_obj.data, ratio, name)
+            result = bpy.data.objects.new(name, mesh)
+            result.matrix_basis = source_obj.matrix_basis.copy()
+            self.context.scene.objects.link(result)
+            record['vertices'] = len(mesh.vertices)
+            record['polygons'] = len(mesh.polygons)
+        return result
+    def checkMemoryBudget(self, accumulator, group=None):
+        # flush orphaned mesh data created by the build and collect garbage when over the memory budget,
+        # the process rarely returns memory so later flushes wait until usage has grown by a margin
+        budget = self.context.scene.hilo_memorybudget * 1024 * 1024
+        if (budget <= 0):
+            return
+        usage = hilo_memory_usage()
+        if (usage is None):
+            usage = accumulator.nbytes()
+        if (usage <= budget):
+            return
+        if ((not self.flush_usage is None) and (usage < self.flush_usage + budget * hilo_memory_flush_margin)):
+            return
+        with self.profiler.phase(group, 'flush') as record:
+            record['datablocks'] = self.tracker.purge() if (not self.tracker is None) else 0
+            gc.collect()
+        self.flush_usage = hilo_memory_usage()
+        if (self.flush_usage is None):
+            self.flush_usage = usage
+    def unwrap(self, final_obj, group=None):
+        # uv unwrap lowpoly model
+        context = self.context
+        unwrap_mode = context.scene.hilo_autounwrapmode
+        if (unwrap_mode == 'none'):
+            return
+        mesh = final_obj.data
+        with self.profiler.phase(group, 'unwrap', object=final_obj.name, vertices=len(mesh.vertices), polygons=len(mesh.polygons)) as record:
+            # reuse the layout of unchanged geometry
+            if (not self.uv_cache is None):
+                cache_key = self.uv_cache.key(mesh, unwrap_mode)
+                uv = self.uv_cache.get(cache_key)
+                if ((not uv is None) and (len(uv) == len(mesh.loops))):
+                    if (mesh.uv_layers.active is None):
+                        mesh.uv_textures.new()
+                    hilo_foreach_set(mesh.uv_layers.active.data, 'uv', uv)
+                    mesh.update()
+                    record['cached'] = True
+                    return
+            # cube projection runs without edit mode
+            if (unwrap_mode == 'cube-project'):
+                hilo_cube_project(mesh)
+            else:
+                context.scene.objects.active = final_obj
+                bpy.ops.object.mode_set(mode='EDIT')
+                bpy.ops.mesh.select_all(action='SELECT')
+                if (unwrap_mode == 'smart-unwrap'):
+                    bpy.ops.uv.smart_project(island_margin=0.01)
+                elif (unwrap_mode == 'unwrap'):
+                    bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.1)
+                bpy.ops.object.mode_set(mode='OBJECT')
+            if ((not self.uv_cache is None) and (not mesh.uv_layers.active is None)):
+                self.uv_cache.put(cache_key, hilo_foreach_get(mesh.uv_layers.active.data, 'uv', np.float32, 2))
+
+    def buildGroup(self, group, group_hash=None):
+        groups = self.groups
+        final_names = self.finalNames(group)
+
+        group_name = groups.groupName(group)
+        origin = groups.getOrigin(group).copy()
+
+        # join highpoly meshes into highpoly result
+        highpoly_result = self.joinObjects(groups.getHighpolyMeshes(group), final_names['highpoly'], origin, group_name)
+        self.tagFinal(highpoly_result, group_hash)
+
+        # join lowpoly meshes into lowpoly result, or decimate the highpoly result
+        if (groups.isDecimated(group)):
+            lowpoly_result = self.decimateObject(highpoly_result, final_names['lowpoly'], self.decimateRatio(highpoly_result), group_name)
+        else:
+            lowpoly_result = self.joinObjects(groups.getLowpolyMeshes(group), final_names['lowpoly'], origin, group_name)
+        self.tagFinal(lowpoly_result, group_hash)
+        self.unwrap(lowpoly_result, group_name)
+        results = [lowpoly_result, highpoly_result]
+
+        # get cage mesh for group (if there is one specified)
+        cage_obj = groups.getCage(group)
+        if (not cage_obj is None):
+            cage_result = self.joinObjects([cage_obj], final_names['cage'], origin, group_name)
+            self.tagFinal(cage_result, group_hash)
+            results.append(cage_result)
+        elif (self.autoCage()):
+            cage_result = self.generateCage(lowpoly_result, highpoly_result, final_names['cage'], group_name)
+            self.tagFinal(cage_result, group_hash)
+            results.append(cage_result)
+
+        # lod chain, each lod is decimated from the previous one and keeps its uv layout
+        previous_result = lowpoly_result
+        for role in groups.getLodRoles():
+            lod_result = self.decimateObject(previous_result, final_names[role], self.context.scene.hilo_lodratio, group_name)
+            self.tagFinal(lod_result, group_hash)
+            results.append(lod_result)
+            previous_result = lod_result
+        return results
+
+
+class HiloWorkerPool:
+    def __init__(self, blend_filepath, work_dir, log_dir):
+        self.blend_filepath = blend_filepath
+        self.work_dir = work_dir
+        self.log_dir = log_dir
+    def command(self, job_filepath):
+        return [bpy.app.binary_path, '--background', '--factory-startup', self.blend_filepath,
+                '--python', os.path.abspath(__file__), '--', '--hilo-worker', job_filepath]
+    def run(self, jobs):
+        # run one background blender process per job and wait for all of them
+        # returns [(job, result or None, log filepath), ...] in job order
+        processes = []
+        for i_job in range(0, len(jobs)):
+            job = dict(jobs[i_job])
+            job['result'] = os.path.join(self.work_dir, 'worker_%d.json' % (i_job))
+            job['output'] = os.path.join(self.work_dir, 'worker_%d.blend' % (i_job))
+            job_filepath = os.path.join(self.work_dir, 'worker_%d_job.json' % (i_job))
+            with open(job_filepath, 'w') as job_file:
+                json.dump(job, job_file)
+            log_filepath = os.path.join(self.log_dir, 'worker_%d.log' % (i_job))
+            log_file = open(log_filepath, 'w')
+            process = subprocess.Popen(self.command(job_filepath), stdout=log_file, stderr=subprocess.STDOUT)
+            processes.append((job, process, log_file, log_filepath))
+        results = []
+        for job, process, log_file, log_filepath in processes:
+            returncode = process.wait()
+            log_file.close()
+            result = None
+            if ((returncode == 0) and os.path.exists(job['result'])):
+                with open(job['result']) as result_file:
+                    result = json.load(result_file)
+            results.append((job, result, log_filepath))
+        return results
+
+
+def hilo_worker_count(scene, job_count):
+    worker_count = scene.hilo_workercount
+    if (worker_count <= 0):
+        worker_count = os.cpu_count() or 1
+    return max(1, min(worker_count, job_count))
+
+
+def hilo_worker_build(job):
+    # build final meshes of the job's groups and save them for the main process
+    context = bpy.context
+    groups = hilo_scene_mesh_groups(context.scene)
+    context.scene.update()
+    uv_cache = hilo_scene_uv_cache(context.scene, job.get('uv_cache'))
+    builder = HiloFinalMeshBuilder(context, groups, uv_cache=uv_cache, tracker=HiloDatablockTracker())
+    result = {'groups': {}}
+    final_objects = set()
+    for group_name, group_hash in job['groups']:
+        start = time.perf_counter()
+        builder.removeGroup(group_name)
+        group_objects = builder.buildGroup(group_name, group_hash)
+        final_objects.update(group_objects)
+        result['groups'][group_name] = {'objects':   [obj.name for obj in group_objects],
+                                        'materials': dict((obj.name, [getattr(slot.material, 'name', None) for slot in obj.material_slots]) for obj in group_objects),
+                                        'time':      time.perf_counter() - start}
+    if (hasattr(bpy.data.libraries, 'write')):
+        bpy.data.libraries.write(job['output'], final_objects)
+    else:
+        bpy.ops.wm.save_as_mainfile(filepath=job['output'], copy=True)
+    if (not uv_cache is None):
+        result['uv_cache'] = uv_cache.statistics()
+    return result
+
+
+hilo_worker_tasks = {'build': hilo_worker_build}
+
+
+def hilo_worker_main(job_filepath):
+    # entry point of background worker processes, see `HiloWorkerPool`
+    with open(job_filepath) as job_file:
+        job = json.load(job_file)
+    result = hilo_worker_tasks[job['task']](job)
+    with open(job['result'], 'w') as result_file:
+        json.dump(result, result_file)
+
+
+# datablocks worker files share with the main file, in the order their users are removed
+hilo_shared_collections = ('materials', 'textures', 'images')
+
+
+def hilo_restore_materials(objects, material_names, before):
+    # appending worker results brings copies of the source materials (`name.001`, with their textures and images),
+    # point the material slots back to the local materials and remove the copies
+    # material_names: object name -> material name per slot, as assigned in the worker
+    # before: collection name -> pointers of the datablocks before appending
+    for obj in objects:
+        for slot, material_name in zip(obj.material_slots, material_names.get(obj.name, [])):
+            local = bpy.data.materials.get(material_name) if (not material_name is None) else None
+            if ((not local is None) and (local.as_pointer() in before['materials'])):
+                slot.material = local
+    for name in hilo_shared_collections:
+        collection = getattr(bpy.data, name)
+        for appended in [idb for idb in collection if (not idb.as_pointer() in before[name])]:
+            if (appended.users == 0):
+                collection.remove(appended)
+
+
+def hilo_parallel_rebuild_groups(context, builder, dirty_groups, report):
+    # rebuild final meshes in background workers, returns the build time per group or None
+    worker_count = hilo_worker_count(context.scene, len(dirty_groups))
+    jobs = []
+    for i_worker in range(0, worker_count):
+        jobs.append({'task': 'build', 'groups': dirty_groups[i_worker::worker_count]})
+    # workers share the uv cache directory of this file
+    if (not builder.uv_cache is None):
+        for job in jobs:
+            job['uv_cache'] = builder.uv_cache.directory
+    report({'INFO'}, 'rebuilding %d mesh groups in %d workers' % (len(dirty_groups), worker_count))
+    work_dir = tempfile.mkdtemp(prefix='hilo_')
+    try:
+        # workers read the current state of the scene from a copy of the .blend file
+        blend_filepath = os.path.join(work_dir, 'scene.blend')
+        bpy.ops.wm.save_as_mainfile(filepath=blend_filepath, copy=True)
+        log_dir = bpy.path.abspath(context.scene.hilo_workerlogpath)
+        if (not os.path.isdir(log_dir)):
+            os.makedirs(log_dir)
+        results = HiloWorkerPool(blend_filepath, work_dir, log_dir).run(jobs)
+        failed = [log_filepath for job, result, log_filepath in results if result is None]
+        if (len(failed) > 0):
+            for log_filepath in failed:
+                report({'ERROR'}, 'worker failed, see `%s`' % (log_filepath))
+            return None
+        # merge worker results in group order
+        for group_name, group_hash in dirty_groups:
+            builder.removeGroup(group_name)
+        final_objects = {}
+        build_times = {}
+        before = dict((name, set([idb.as_pointer() for idb in getattr(bpy.data, name)])) for name in hilo_shared_collections)
+        for job, result, log_filepath in results:
+            object_names = [name for group in result['groups'].values() for name in group['objects']]
+            with bpy.data.libraries.load(job['output']) as (data_from, data_to):
+                data_to.objects = object_names
+            for name, obj in zip(object_names, data_to.objects):
+                final_objects[name] = obj
+            for group_name, group in result['groups'].items():
+                build_times[group_name] = group['time']
+            if ((not builder.uv_cache is None) and ('uv_cache' in result)):
+                builder.uv_cache.hits += result['uv_cache']['hits']
+                builder.uv_cache.misses += result['uv_cache']['misses']
+        for group_name, group_hash in dirty_groups:
+            for job, result, log_filepath in results:
+                if (group_name in result['groups']):
+                    for name in result['groups'][group_name]['objects']:
+                        context.scene.objects.link(final_objects[name])
+        # worker files bring their own copies of the source materials
+        material_names = {}
+        for job, result, log_filepath in results:
+            for group in result['groups'].values():
+                material_names.update(group.get('materials', {}))
+        hilo_restore_materials(final_objects.values(), material_names, before)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return build_times
 
 
 class HiloCreateFinalMesh(bpy.types.Operator):
@@ -639,116 +2560,26 @@ class HiloCreateFinalMesh(bpy.types.Operator):
 
     def execute(self, context):
         # find mesh groups in scene
-        groups = HiloMeshGroups(context.scene.objects.values())
+        profiler = hilo_scene_profiler(context.scene)
+        try:
+            with profiler.phase(None, 'classify'):
+                groups = hilo_scene_mesh_groups(context.scene)
 
-        # update scene
-        context.scene.update()
-        
-        # for each group:
-        for i_group in range(0, groups.groupCount()):
-
-            # create lowpoly result object
-            bpy.ops.object.add(type='MESH')
-            lowpoly_result = context.active_object
-
-            # for each lowpoly mesh in group
-            final_meshes = []
-            for lowpoly_obj in groups.getLowpolyMeshes(i_group):
-                # duplicate mesh and apply modifiers
-                final_mesh = lowpoly_obj.to_mesh(scene=context.scene, apply_modifiers=True, settings='PREVIEW')
-                final_mesh_obj = bpy.data.objects.new(lowpoly_obj.name + ".final", final_mesh)
-                context.scene.objects.link(final_mesh_obj)
-                final_mesh_obj.location = lowpoly_obj.location
-                final_mesh_obj.rotation_euler = lowpoly_obj.rotation_euler.copy()
-                final_meshes.append(final_mesh_obj)
-            # join temp objects into lowpoly result
-            bpy.ops.object.select_all(action='DESELECT')
-            for final_mesh in final_meshes:
-                final_mesh.select = True
-            lowpoly_result.select = True
-            context.scene.objects.active = lowpoly_result
-            bpy.ops.object.join()
-            # rename lowpoly result
-            lowpoly_result.name = groups.group_names[i_group] + groups.lowpolymeshsuffix
-            # update scene
-            context.scene.update()
-            # move to group origin
-            context.scene.cursor_location = groups.getOrigin(i_group)
-            context.scene.objects.active = lowpoly_result
-            bpy.ops.objects.hilosetobjectorigintocursor()
-
-            # uv unwrap lowpoly model
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            unwrap_mode = context.scene.hilo_autounwrapmode
-            if (unwrap_mode == 'smart-unwrap'):
-                bpy.ops.uv.smart_project(island_margin=0.01)
-            elif (unwrap_mode == 'unwrap'):
-                bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.1)
-            elif (unwrap_mode == 'cube-project'):
-                bpy.ops.uv.cube_project()
-            else:
-                pass # none = No auto-unwrap
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            # create highpoly result object
-            bpy.ops.object.add(type='MESH')
-            highpoly_result = context.active_object
-
-            # for each highpoly mesh
-            final_meshes = []
-            for highpoly_obj in groups.getHighpolyMeshes(i_group):
-                # duplicate mesh and apply modifiers
-                final_mesh = highpoly_obj.to_mesh(scene=context.scene, apply_modifiers=True, settings='PREVIEW')
-                final_mesh_obj = bpy.data.objects.new(highpoly_obj.name + ".final", final_mesh)
-                context.scene.objects.link(final_mesh_obj)
-                final_mesh_obj.location = highpoly_obj.location
-                final_mesh_obj.rotation_euler = highpoly_obj.rotation_euler.copy()
-                final_meshes.append(final_mesh_obj)
-            # join temp object into highpoly result
-            bpy.ops.object.select_all(action='DESELECT')
-            for final_mesh in final_meshes:
-                final_mesh.select = True
-            highpoly_result.select = True
-            context.scene.objects.active = highpoly_result
-            bpy.ops.object.join()
-            # rename highpoly result
-            highpoly_result.name = groups.group_names[i_group] + groups.highpolymeshsuffix
             # update scene
             context.scene.update()
-            # move to group origin
-            context.scene.cursor_location = groups.getOrigin(i_group)
-            context.scene.objects.active = highpoly_result
-            bpy.ops.objects.hilosetobjectorigintocursor()
-
-            # get cage mesh for group (if there is one specified)
-            cage_obj = groups.getCage(i_group)
-            if (not cage_obj is None):
-                # create cage result object
-                bpy.ops.object.add(type='MESH')
-                cage_result = context.active_object
-                # duplicate mesh and apply modifiers
-                final_mesh = cage_obj.to_mesh(scene=context.scene, apply_modifiers=True, settings='PREVIEW')
-                final_mesh_obj = bpy.data.objects.new(cage_obj.name + ".final", final_mesh)
-                context.scene.objects.link(final_mesh_obj)
-                final_mesh_obj.location = cage_obj.location
-                final_mesh_obj.rotation_euler = cage_obj.rotation_euler.copy()
-                # join temp object into cage result
-                bpy.ops.object.select_all(action='DESELECT')
-                final_mesh_obj.select = True
-                cage_result.select = True
-                context.scene.objects.active = cage_result
-                bpy.ops.object.join()
-                # rename cage result
-                cage_result.name = groups.group_names[i_group] + "_cage"
-                # update scene
-                context.scene.update()
-                # move to group origin
-                context.scene.cursor_location = groups.getOrigin(i_group)
-                context.scene.objects.active = cage_result
-                bpy.ops.objects.hilosetobjectorigintocursor()
+            tracker = HiloDatablockTracker()
+        
+            # for each group:
+            builder = HiloFinalMeshBuilder(context, groups, profiler, tracker=tracker)
+            for i_group in range(0, groups.groupCount()):
+                builder.buildGroup(i_group, builder.groupHash(i_group))
 
-        return {'FINISHED'}
+            tracker.finish(context.scene, self.report)
+            if (not builder.uv_cache is None):
+                builder.uv_cache.report(self.report)
+            return {'FINISHED'}
+        finally:
+            profiler.finish(context.scene, self.report)
 
 
 class HiloRefreshFinalMesh(bpy.types.Operator):
@@ -758,117 +2589,988 @@ class HiloRefreshFinalMesh(bpy.types.Operator):
 
     def execute(self, context):
         # create mesh groups
-        groups = HiloMeshGroups(context.scene.objects.values())
-        # remove existing final meshes
-        for i_group in range(0, groups.groupCount()):
-            bpy.ops.object.select_all(action='DESELECT')
-            for group_name in groups.group_names:
-                if (bpy.data.objects.find(group_name + '_low') > -1):
-                    lowpoly_final = bpy.data.objects[group_name + '_low']
-                    context.scene.objects.unlink(lowpoly_final)
-                    bpy.data.objects.remove(lowpoly_final)
-                if (bpy.data.objects.find(group_name + '_high') > -1):
-                    highpoly_final = bpy.data.objects[group_name + '_high']
-                    context.scene.objects.unlink(highpoly_final)
-                    bpy.data.objects.remove(highpoly_final)
-                if (bpy.data.objects.find(group_name + '_cage') > -1):
-                    cage_final = bpy.data.objects[group_name + '_cage']
-                    context.scene.objects.unlink(cage_final)
-                    bpy.data.objects.remove(cage_final)
-        # recreate lowpoly meshes
-        bpy.ops.objects.hilocreatefinalmesh()
-        return {'FINISHED'}
+        profiler = hilo_scene_profiler(context.scene)
+        try:
+            with profiler.phase(None, 'classify'):
+                groups = hilo_scene_mesh_groups(context.scene)
+            # update scene
+            context.scene.update()
+            # find groups to rebuild
+            tracker = HiloDatablockTracker()
+            builder = HiloFinalMeshBuilder(context, groups, profiler, tracker=tracker)
+            dirty_groups = builder.dirtyGroups(context.scene.hilo_incrementalrefresh)
+            # recreate final meshes
+            builder.rebuildGroups(dirty_groups)
+            self.report({'INFO'}, 'rebuilt %d of %d mesh groups' % (len(dirty_groups), groups.groupCount()))
+            tracker.finish(context.scene, self.report)
+            if (not builder.uv_cache is None):
+                builder.uv_cache.report(self.report)
+            return {'FINISHED'}
+        finally:
+            profiler.finish(context.scene, self.report)
+
+
+class HiloParallelRefreshFinalMesh(bpy.types.Operator):
+    '''Recreate final meshes in background worker processes. Existing final meshes are overwritten'''
+    bl_idname = "objects.hiloparallelrefreshfinalmesh"
+    bl_label = "Hilo - Refresh Final Meshes (Parallel)"
 
+    def execute(self, context):
+        # create mesh groups
+        profiler = hilo_scene_profiler(context.scene)
+        try:
+            with profiler.phase(None, 'classify'):
+                groups = hilo_scene_mesh_groups(context.scene)
+            # update scene
+            context.scene.update()
+            # find groups to rebuild
+            tracker = HiloDatablockTracker()
+            builder = HiloFinalMeshBuilder(context, groups, profiler, tracker=tracker)
+            dirty_groups = builder.dirtyGroups(context.scene.hilo_incrementalrefresh)
+            if (len(dirty_groups) == 0):
+                self.report({'INFO'}, 'rebuilt 0 of %d mesh groups' % (groups.groupCount()))
+                return {'FINISHED'}
+            if (hilo_parallel_rebuild_groups(context, builder, dirty_groups, self.report) is None):
+                return {'CANCELLED'}
+            self.report({'INFO'}, 'rebuilt %d of %d mesh groups' % (len(dirty_groups), groups.groupCount()))
+            tracker.finish(context.scene, self.report)
+            if (not builder.uv_cache is None):
+                builder.uv_cache.report(self.report)
+            return {'FINISHED'}
+        finally:
+            profiler.finish(context.scene, self.report)
+
+
+# y up output, like blender's bundled exporters (forward -Z, up Y)
+def hilo_y_up(vectors):
+    return np.column_stack((vectors[:, 0], vectors[:, 2], -vectors[:, 1]))
+
+
+# rows per write, bounds the memory of text formatting
+hilo_export_chunk_size = 65536
+
+
+def hilo_write_rows(out_file, fmt, rows):
+    # write formatted rows to a binary file in chunks
+    for i_row in range(0, len(rows), hilo_export_chunk_size):
+        chunk = rows[i_row:i_row + hilo_export_chunk_size]
+        out_file.write((((fmt + '\n') * len(chunk)) % tuple(chunk.ravel().tolist())).encode('utf-8'))
+
+
+def hilo_export_normals(buf):
+    # per loop normals of a mesh buffer
+    if (not buf.loop_normal is None):
+        return buf.loop_normal
+    return hilo_loop_normals(buf)
+
+
+class HiloObjectMeshes:
+    # re-iterable (name, HiloMeshBuffer) pairs of objects in world space,
+    # each mesh is read when it is reached and released afterwards
+    def __init__(self, objects):
+        self.objects = objects
+    def __iter__(self):
+        for obj in self.objects:
+            yield (obj.name, HiloMeshBuffer().readMesh(obj.data, obj.matrix_world))
+
+
+def hilo_write_obj(filepath, meshes):
+    # stream (name, HiloMeshBuffer) pairs to a wavefront .obj file
+    with open(filepath, 'wb') as obj_file:
+        obj_file.write(b'# hilo final meshes\n')
+        vertex_offset = 1
+        loop_offset = 1     # normals are written for every mesh
+        uv_offset = 1       # uv coordinates only for meshes with uv layers
+        for name, buf in meshes:
+            obj_file.write(('o %s\n' % (name)).encode('utf-8'))
+            hilo_write_rows(obj_file, 'v %.6f %.6f %.6f', hilo_y_up(buf.co))
+            # uv coordinates and normals are written per loop
+            has_uv = (len(buf.uv_layers) > 0)
+            if (has_uv):
+                hilo_write_rows(obj_file, 'vt %.6f %.6f', buf.uv_layers[0][1])
+            hilo_write_rows(obj_file, 'vn %.4f %.4f %.4f', hilo_y_up(hilo_export_normals(buf)))
+            loop_index = np.arange(buf.loopCount(), dtype=np.int64)
+            if (has_uv):
+                corners = np.column_stack((buf.loop_vertex + vertex_offset, loop_index + uv_offset, loop_index + loop_offset))
+                corner_fmt = ' %d/%d/%d'
+            else:
+                corners = np.column_stack((buf.loop_vertex + vertex_offset, loop_index + loop_offset))
+                corner_fmt = ' %d//%d'
+            # faces grouped by material and corner count
+            for material_index in np.unique(buf.poly_material):
+                if (material_index < len(buf.materials)):
+                    obj_file.write(('usemtl %s\n' % (getattr(buf.materials[material_index], 'name', 'None'))).encode('utf-8'))
+                is_material = (buf.poly_material == material_index)
+                for loop_total in np.unique(buf.poly_loop_total[is_material]):
+                    polys = np.nonzero(is_material & (buf.poly_loop_total == loop_total))[0]
+                    loops = (buf.poly_loop_start[polys][:, np.newaxis] + np.arange(loop_total)).ravel()
+                    rows = corners[loops].reshape(len(polys), -1)
+                    hilo_write_rows(obj_file, 'f' + corner_fmt * int(loop_total), rows)
+            vertex_offset += buf.vertexCount()
+            loop_offset += buf.loopCount()
+            if (has_uv):
+                uv_offset += buf.loopCount()
+
+
+def hilo_gltf_arrays(buf):
+    # glTF vertex attributes and triangle indices of a mesh buffer, vertices are split per loop
+    arrays = [('POSITION', hilo_y_up(buf.co[buf.loop_vertex]).astype(np.float32)),
+              ('NORMAL', hilo_normalize(hilo_y_up(hilo_export_normals(buf))).astype(np.float32))]
+    if (len(buf.uv_layers) > 0):
+        uv = buf.uv_layers[0][1].astype(np.float32)
+        arrays.append(('TEXCOORD_0', np.column_stack((uv[:, 0], 1.0 - uv[:, 1])).astype(np.float32)))
+    # fan triangulation of each polygon
+    tri_total = buf.poly_loop_total - 2
+    tri_poly = np.repeat(np.arange(buf.polygonCount()), tri_total)
+    tri_corner = np.arange(len(tri_poly)) - np.repeat(np.cumsum(tri_total) - tri_total, tri_total) + 1
+    tri_start = buf.poly_loop_start[tri_poly]
+    arrays.append(('indices', np.column_stack((tri_start, tri_start + tri_corner, tri_start + tri_corner + 1)).astype(np.uint32)))
+    return arrays
+
+
+def hilo_write_glb(filepath, meshes):
+    # stream (name, HiloMeshBuffer) pairs to a binary glTF 2.0 file
+    # the json chunk precedes the binary chunk, so a first pass collects sizes and bounds
+    gltf = {'asset': {'version': '2.0', 'generator': 'hilo'},
+            'scene': 0, 'scenes': [{'nodes': []}],
+            'nodes': [], 'meshes': [], 'accessors': [], 'bufferViews': []}
+    byte_length = 0
+    for name, buf in meshes:
+        gltf['scenes'][0]['nodes'].append(len(gltf['nodes']))
+        if (buf.polygonCount() == 0):
+            gltf['nodes'].append({'name': name})
+            continue
+        primitive = {'attributes': {}, 'mode': 4}
+        for attr, values in hilo_gltf_arrays(buf):
+            gltf['bufferViews'].append({'buffer': 0, 'byteOffset': byte_length, 'byteLength': values.nbytes,
+                                        'target': 34963 if (attr == 'indices') else 34962})
+            accessor = {'bufferView': len(gltf['bufferViews']) - 1,
+                        'componentType': 5125 if (attr == 'indices') else 5126,
+                        'count': values.size if (attr == 'indices') else len(values),
+                        'type': 'SCALAR' if (attr == 'indices') else ('VEC%d' % (values.shape[1]))}
+            if (attr == 'POSITION'):
+                accessor['min'] = values.min(axis=0).tolist()
+                accessor['max'] = values.max(axis=0).tolist()
+            gltf['accessors'].append(accessor)
+            if (attr == 'indices'):
+                primitive['indices'] = len(gltf['accessors']) - 1
+            else:
+                primitive['attributes'][attr] = len(gltf['accessors']) - 1
+            byte_length += values.nbytes
+        gltf['nodes'].append({'name': name, 'mesh': len(gltf['meshes'])})
+        gltf['meshes'].append({'name': name, 'primitives': [primitive]})
+    if (byte_length > 0):
+        gltf['buffers'] = [{'byteLength': byte_length}]
+    else:
+        del gltf['bufferViews'], gltf['accessors'], gltf['meshes']
+    json_chunk = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    total_length = 12 + 8 + len(json_chunk) + ((8 + byte_length) if (byte_length > 0) else 0)
+    with open(filepath, 'wb') as glb_file:
+        glb_file.write(np.array([0x46546C67, 2, total_length, len(json_chunk), 0x4E4F534A], dtype='<u4').tobytes())
+        glb_file.write(json_chunk)
+        if (byte_length > 0):
+            # second pass streams the binary chunk mesh by mesh
+            glb_file.write(np.array([byte_length, 0x004E4942], dtype='<u4').tobytes())
+            for name, buf in meshes:
+                if (buf.polygonCount() > 0):
+                    for attr, values in hilo_gltf_arrays(buf):
+                        glb_file.write(values.astype(values.dtype.newbyteorder('<')).tobytes())
+
+
+def hilo_write_atomic(filepath, write):
+    # call `write` with a temporary path next to `filepath`, then replace `filepath` with the complete file
+    base, ext = os.path.splitext(filepath)
+    temp_filepath = '%s.%d-%d.tmp%s' % (base, os.getpid(), threading.get_ident(), ext)
+    try:
+        write(temp_filepath)
+        os.replace(temp_filepath, filepath)
+    finally:
+        if (os.path.exists(temp_filepath)):
+            os.remove(temp_filepath)
+
+
+# export manifest and per-group index, stored in the output directory
+hilo_manifest_filename = 'hilo_manifest.json'
+hilo_index_filename = 'hilo_index.json'
+
+
+class HiloExportManifest:
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.files = {}  # path relative to the manifest -> {'hash', 'settings', 'objects', 'time'}
+        if (os.path.isfile(filepath)):
+            try:
+                with open(filepath) as manifest_file:
+                    self.files = json.load(manifest_file).get('files', {})
+            except (IOError, OSError, ValueError):
+                self.files = {}
+    def key(self, filepath):
+        return os.path.relpath(filepath, os.path.dirname(self.filepath)).replace(os.sep, '/')
+    def isCurrent(self, filepath, content_hash):
+        # True if `filepath` exists and was exported from the same content
+        entry = self.files.get(self.key(filepath))
+        return ((not entry is None) and (entry.get('hash') == content_hash) and os.path.isfile(filepath))
+    def update(self, filepath, content_hash, settings, objects):
+        self.files[self.key(filepath)] = {'hash': content_hash,
+                                          'settings': settings,
+                                          'objects': [obj.name for obj in objects],
+                                          'time': time.time()}
+    def save(self):
+        def write(temp_filepath):
+            with open(temp_filepath, 'w') as manifest_file:
+                json.dump({'version': 1, 'files': self.files}, manifest_file, indent=2, sort_keys=True)
+        hilo_write_atomic(self.filepath, write)
+
+
+# writers of the streamed output formats, fbx uses blender's bundled exporter
+hilo_mesh_writers = {'obj': hilo_write_obj,
+                     'glb': hilo_write_glb}
+
+
+def hilo_ray_distances(target_obj, scene, co, normals, max_distance, matrix=None):
+    # distances from world space points along their normals (outward, inward) to the surface
+    # of `target_obj`, nan where there is no surface within `max_distance`
+    # matrix: world transform of `target_obj`, defaults to its `matrix_world`
+    if (len(co) == 0):
+        return (np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64))
+    # the bvh tree is built in the target's object space, rays are moved there
+    tree = BVHTree.FromObject(target_obj, scene, deform=False)
+    matrix = np.array(target_obj.matrix_world if (matrix is None) else matrix, dtype=np.float64)
+    inverse = np.linalg.inv(matrix)
+    origins = co.dot(inverse[:3, :3].T) + inverse[:3, 3]
+    directions = hilo_normalize(normals.dot(inverse[:3, :3].T))
+    local_distance = max_distance * np.abs(inverse[:3, :3]).sum(axis=0).max()
+    hits = np.full((2, len(origins), 3), np.nan)
+    ray_cast = tree.ray_cast
+    for i_vertex, (origin, direction) in enumerate(zip(origins.tolist(), directions.tolist())):
+        origin = Vector(origin)
+        direction = Vector(direction)
+        location = ray_cast(origin, direction, local_distance)[0]
+        if (not location is None):
+            hits[0, i_vertex] = location
+        location = ray_cast(origin, -direction, local_distance)[0]
+        if (not location is None):
+            hits[1, i_vertex] = location
+    # measure in world space
+    hits = hits.dot(matrix[:3, :3].T) + matrix[:3, 3]
+    distances = np.sqrt(((hits - co) ** 2).sum(axis=2))
+    distances[distances > max_distance] = np.nan
+    return (distances[0], distances[1])
+
+
+class HiloCoverageAnalyzer:
+    def __init__(self, context, groups, report, profiler=None):
+        self.context = context
+        self.groups = groups
+        self.report = report  # same signature as `bpy.types.Operator.report`
+        self.profiler = profiler if (not profiler is None) else HiloProfiler()
+    def finalObject(self, group_name, role):
+        final_obj = bpy.data.objects.get(self.groups.getFinalNames(group_name)[role])
+        if ((final_obj is None) or (final_obj.type != 'MESH')):
+            return None
+        return final_obj
+    def cacheKey(self, lowpoly_obj, highpoly_obj):
+        # geometry hash of both final meshes and the search distance
+        sha = hashlib.sha1()
+        sha.update(repr(self.context.scene.hilo_coveragedistance).encode('utf-8'))
+        for obj in (lowpoly_obj, highpoly_obj):
+            sha.update(repr([tuple(row) for row in obj.matrix_world]).encode('utf-8'))
+            hilo_topology_hash(sha, obj.data)
+        return sha.hexdigest()
+    def measure(self, lowpoly_obj, highpoly_obj):
+        # distance from each lowpoly vertex to the highpoly surface along the vertex normal,
+        # in both directions, nan if there is no surface within the coverage distance
+        buf = HiloMeshBuffer().readMesh(lowpoly_obj.data, lowpoly_obj.matrix_world)
+        outward, inward = hilo_ray_distances(highpoly_obj, self.context.scene, buf.co, hilo_vertex_normals(buf),
+                                             self.context.scene.hilo_coveragedistance)
+        return np.fmin(outward, inward)
+    def analyzeGroup(self, group_name, lowpoly_obj, highpoly_obj):
+        # coverage of one group, cached by geometry hash
+        key = self.cacheKey(lowpoly_obj, highpoly_obj)
+        result = hilo_coverage_cache.get(key)
+        if (result is None):
+            with self.profiler.phase(group_name, 'coverage', object=lowpoly_obj.name,
+                                     vertices=len(lowpoly_obj.data.vertices), polygons=len(highpoly_obj.data.polygons)):
+                distances = self.measure(lowpoly_obj, highpoly_obj)
+            hit = distances[~np.isnan(distances)]
+            result = {'vertices':      len(distances),
+                      'misses':        len(distances) - len(hit),
+                      'max_distance':  float(hit.max()) if (len(hit) > 0) else None,
+                      'mean_distance': float(hit.mean()) if (len(hit) > 0) else None}
+            hilo_coverage_cache[key] = result
+            while (len(hilo_coverage_cache) > 1024):
+                hilo_coverage_cache.popitem(last=False)
+        else:
+            hilo_coverage_cache.move_to_end(key)
+        return dict(result)
+    def analyze(self):
+        # returns {group name: coverage or None if final meshes are missing}
+        results = {}
+        bounds = []
+        for group_name in self.groups.group_names:
+            lowpoly_obj = self.finalObject(group_name, 'lowpoly')
+            highpoly_obj = self.finalObject(group_name, 'highpoly')
+            if ((lowpoly_obj is None) or (highpoly_obj is None)):
+                self.report({'ERROR'}, 'coverage `%s`: final meshes not found. Recreate meshes and try again.' % (group_name))
+                results[group_name] = None
+                continue
+            results[group_name] = self.analyzeGroup(group_name, lowpoly_obj, highpoly_obj)
+            results[group_name]['overlaps'] = []
+            group_bounds = [b for b in (hilo_object_bounds(lowpoly_obj), hilo_object_bounds(highpoly_obj)) if (not b is None)]
+            if (len(group_bounds) > 0):
+                bounds.append((group_name, np.min([b[0] for b in group_bounds], axis=0), np.max([b[1] for b in group_bounds], axis=0)))
+        # groups with overlapping bounding boxes bake into each other
+        if (len(bounds) > 1):
+            names = [name for name, bounds_min, bounds_max in bounds]
+            mins = np.array([bounds_min for name, bounds_min, bounds_max in bounds])
+            maxs = np.array([bounds_max for name, bounds_min, bounds_max in bounds])
+            overlap = np.all((mins[:, np.newaxis, :] <= maxs[np.newaxis, :, :]) & (mins[np.newaxis, :, :] <= maxs[:, np.newaxis, :]), axis=2)
+            np.fill_diagonal(overlap, False)
+            for i_group, name in enumerate(names):
+                results[name]['overlaps'] = [names[j] for j in np.nonzero(overlap[i_group])[0]]
+        return results
+    def reportResults(self, results):
+        for group_name in self.groups.group_names:
+            result = results.get(group_name)
+            if (result is None):
+                continue
+            if (result['max_distance'] is None):
+                distances = 'no highpoly surface found'
+            else:
+                distances = 'max distance %.4f, mean distance %.4f' % (result['max_distance'], result['mean_distance'])
+            level = {'WARNING'} if ((result['misses'] > 0) or (len(result['overlaps']) > 0)) else {'INFO'}
+            self.report(level, 'coverage `%s`: %d vertices, %s, %d misses%s' %
+                        (group_name, result['vertices'], distances, result['misses'],
+                         (', overlaps ' + ', '.join(result['overlaps'])) if (len(result['overlaps']) > 0) else ''))
 
-class HiloExportMeshes(bpy.types.Operator):
-    bl_idname = 'objects.hiloexportfinalmesh'
-    bl_label = 'Hilo - Export Final Meshes'
+
+class HiloAnalyzeCoverage(bpy.types.Operator):
+    '''Measure the distance between the final lowpoly and highpoly meshes of each group'''
+    bl_idname = "objects.hiloanalyzecoverage"
+    bl_label = "Hilo - Analyze Coverage"
 
     def execute(self, context):
+        if (BVHTree is None):
+            self.report({'ERROR'}, 'coverage analysis needs blender 2.76 or newer')
+            return {'CANCELLED'}
         # find mesh groups in scene
-        groups = HiloMeshGroups(context.scene.objects.values())
+        profiler = hilo_scene_profiler(context.scene)
+        try:
+            with profiler.phase(None, 'classify'):
+                groups = hilo_scene_mesh_groups(context.scene)
+            analyzer = HiloCoverageAnalyzer(context, groups, self.report, profiler)
+            analyzer.reportResults(analyzer.analyze())
+            return {'FINISHED'}
+        finally:
+            profiler.finish(context.scene, self.report)
+
+
+# bake manifest, stored in the bake directory
+hilo_bake_manifest_filename = 'hilo_bake_manifest.json'
+# bake operator arguments per map
+hilo_bake_passes = {'normal': {'type': 'NORMAL', 'normal_space': 'TANGENT'},
+                    'ao':     {'type': 'AO'}}
+
+
+class HiloBaker:
+    def __init__(self, context, groups, report, profiler=None):
+        self.context = context
+        self.groups = groups
+        self.report = report  # same signature as `bpy.types.Operator.report`
+        self.profiler = profiler if (not profiler is None) else HiloProfiler()
+    def settings(self):
+        # settings that change the content of baked maps
+        scene = self.context.scene
+        maps = [name for name, enabled in (('normal', scene.hilo_bakenormal), ('ao', scene.hilo_bakeao)) if enabled]
+        return {'maps':      maps,
+                'size':      scene.hilo_bakesize,
+                'samples':   scene.hilo_bakesamples,
+                'margin':    scene.hilo_bakemargin,
+                'extrusion': scene.hilo_bakeextrusion}
+    def finalObjects(self, group_name):
+        # (lowpoly, highpoly, cage or None) of a group, None if the lowpoly or highpoly mesh is missing
+        final_names = self.groups.getFinalNames(group_name)
+        lowpoly_obj = bpy.data.objects.get(final_names['lowpoly'])
+        highpoly_obj = bpy.data.objects.get(final_names['highpoly'])
+        if ((lowpoly_obj is None) or (highpoly_obj is None)):
+            return None
+        return (lowpoly_obj, highpoly_obj, bpy.data.objects.get(final_names['cage']))
+    def bakeFilepath(self, group_name, map_name):
+        filename = self.groups.getFinalNames(group_name)['lowpoly'] + '_' + map_name + '.png'
+        return bpy.path.abspath(self.context.scene.hilo_bakepath + filename)
+    def bakeHash(self, objects, settings):
+        # hash of the final meshes, their transforms and the bake settings
+        sha = hashlib.sha1()
+        sha.update(repr(sorted(settings.items())).encode('utf-8'))
+        for obj in objects:
+            if (not obj is None):
+                sha.update(repr((obj.name, [tuple(row) for row in obj.matrix_world])).encode('utf-8'))
+                hilo_mesh_hash(sha, obj.data)
+        return sha.hexdigest()
+    def pendingGroups(self, manifest, settings):
+        # [(group name, bake hash, {map: filepath}), ...] of groups with missing or outdated maps,
+        # None if final meshes are missing
+        scene = self.context.scene
+        pending = []
+        for group_name in self.groups.group_names:
+            objects = self.finalObjects(group_name)
+            if (objects is None):
+                self.report({'ERROR'}, 'could not find final meshes of group %s. Recreate meshes and try again.' % (group_name))
+                return None
+            if (objects[0].data.uv_layers.active is None):
+                self.report({'WARNING'}, '  %s has no uv layout, skip baking' % (objects[0].name))
+                continue
+            bake_hash = self.bakeHash(objects, settings)
+            filepaths = dict([(map_name, self.bakeFilepath(group_name, map_name)) for map_name in settings['maps']])
+            if (scene.hilo_bakeskipunchanged and all([manifest.isCurrent(filepath, bake_hash) for filepath in filepaths.values()])):
+                self.report({'INFO'}, '  %s unchanged, skip baking' % (group_name))
+                continue
+            pending.append((group_name, bake_hash, filepaths))
+        return pending
+    def bake(self):
+        # bake the maps of all groups in background workers, returns True if all maps were baked
+        scene = self.context.scene
+        settings = self.settings()
+        if (len(settings['maps']) == 0):
+            return True
+        manifest_filepath = bpy.path.abspath(scene.hilo_bakepath + hilo_bake_manifest_filename)
+        bake_dir = os.path.dirname(manifest_filepath)
+        if ((bake_dir != '') and (not os.path.isdir(bake_dir))):
+            os.makedirs(bake_dir)
+        manifest = HiloExportManifest(manifest_filepath)
+        pending = self.pendingGroups(manifest, settings)
+        if (pending is None):
+            return False
+        if (len(pending) == 0):
+            return True
+        # split the cpu cores between the workers
+        worker_count = hilo_worker_count(scene, len(pending))
+        thread_count = scene.hilo_bakethreads if (scene.hilo_bakethreads > 0) else max(1, (os.cpu_count() or 1) // worker_count)
+        jobs = []
+        for i_worker in range(0, worker_count):
+            jobs.append({'task':      'bake',
+                         'groups':    pending[i_worker::worker_count],
+                         'settings':  settings,
+                         'threads':   thread_count,
+                         'tile_size': scene.hilo_baketilesize})
+        self.report({'INFO'}, 'baking %d mesh groups in %d workers with %d threads each' % (len(pending), worker_count, thread_count))
+        work_dir = tempfile.mkdtemp(prefix='hilo_')
+        try:
+            # workers read the final meshes from a copy of the .blend file
+            blend_filepath = os.path.join(work_dir, 'scene.blend')
+            bpy.ops.wm.save_as_mainfile(filepath=blend_filepath, copy=True)
+            log_dir = bpy.path.abspath(scene.hilo_workerlogpath)
+            if (not os.path.isdir(log_dir)):
+                os.makedirs(log_dir)
+            with self.profiler.phase(None, 'bake', groups=len(pending), workers=worker_count):
+                results = HiloWorkerPool(blend_filepath, work_dir, log_dir).run(jobs)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        success = True
+        try:
+            for job, result, log_filepath in results:
+                if (result is None):
+                    self.report({'ERROR'}, 'worker failed, see `%s`' % (log_filepath))
+                    success = False
+                    continue
+                for group_name, bake_hash, filepaths in job['groups']:
+                    group = result['groups'][group_name]
+                    if ('error' in group):
+                        self.report({'ERROR'}, '  baking %s failed: %s' % (group_name, group['error']))
+                        success = False
+                        continue
+                    objects = [obj for obj in self.finalObjects(group_name) if (not obj is None)]
+                    for map_name, filepath in sorted(group['files'].items()):
+                        manifest.update(filepath, bake_hash, settings, objects)
+                        self.report({'INFO'}, '  baked %s map of %s to `%s`' % (map_name, group_name, filepath))
+                    self.report({'INFO'}, '  baked %s in %.2fs' % (group_name, group['time']))
+        finally:
+            manifest.save()
+        return success
+    def setupRender(self, settings, thread_count, tile_size):
+        # cycles on cpu with a fixed number of threads, runs in a background worker
+        scene = self.context.scene
+        scene.render.engine = 'CYCLES'
+        scene.cycles.device = 'CPU'
+        scene.cycles.samples = settings['samples']
+        scene.render.tile_x = tile_size
+        scene.render.tile_y = tile_size
+        scene.render.threads_mode = 'FIXED'
+        scene.render.threads = thread_count
+        # ambient occlusion is computed from the world settings
+        if (scene.world is None):
+            scene.world = bpy.data.worlds.new('hilo_bake')
+    def bakeGroup(self, group_name, filepaths, settings):
+        # bake the maps of one group from the highpoly onto the lowpoly, runs in a background worker
+        # returns {map: filepath}
+        lowpoly_obj, highpoly_obj, cage_obj = self.finalObjects(group_name)
+        mesh = lowpoly_obj.data
+        # cycles bakes into the active image texture node of each lowpoly material
+        bake_material = None
+        if (len(mesh.materials) == 0):
+            mesh.materials.append(None)
+        for i_slot in range(0, len(mesh.materials)):
+            if (mesh.materials[i_slot] is None):
+                if (bake_material is None):
+                    bake_material = bpy.data.materials.new(lowpoly_obj.name + '_bake')
+                mesh.materials[i_slot] = bake_material
+        image_nodes = []
+        for material in set(mesh.materials):
+            material.use_nodes = True
+            node = material.node_tree.nodes.new('ShaderNodeTexImage')
+            material.node_tree.nodes.active = node
+            image_nodes.append((material, node))
+        try:
+            return self.bakeMaps(lowpoly_obj, highpoly_obj, cage_obj, [node for material, node in image_nodes], filepaths, settings)
+        finally:
+            # the maps are saved, release the bake images
+            for material, node in image_nodes:
+                material.node_tree.nodes.remove(node)
+    def bakeMaps(self, lowpoly_obj, highpoly_obj, cage_obj, image_nodes, filepaths, settings):
+        # bake each map into a new image assigned to the image nodes and save it, returns {map: filepath}
+        scene = self.context.scene
+        mesh = lowpoly_obj.data
+        # bake selected (highpoly) to active (lowpoly)
+        for obj in scene.objects:
+            obj.select = False
+        for obj in (lowpoly_obj, highpoly_obj):
+            obj.hide = False
+            obj.hide_render = False
+            obj.select = True
+        scene.objects.active = lowpoly_obj
+        files = {}
+        for map_name in settings['maps']:
+            image = bpy.data.images.new(lowpoly_obj.name + '_' + map_name, width=settings['size'], height=settings['size'])
+            if (map_name == 'normal'):
+                image.colorspace_settings.name = 'Non-Color'
+            for node in image_nodes:
+                node.image = image
+            bpy.ops.object.bake(use_selected_to_active=True,
+                                use_cage=(not cage_obj is None),
+                                cage_object=cage_obj.name if (not cage_obj is None) else '',
+                                cage_extrusion=settings['extrusion'],
+                                margin=settings['margin'],
+                                uv_layer=mesh.uv_layers.active.name,
+                                use_clear=True,
+                                **hilo_bake_passes[map_name])
+            def write(temp_filepath):
+                image.filepath_raw = temp_filepath
+                image.file_format = 'PNG'
+                image.save()
+            bake_dir = os.path.dirname(filepaths[map_name])
+            if ((bake_dir != '') and (not os.path.isdir(bake_dir))):
+                os.makedirs(bake_dir)
+            hilo_write_atomic(filepaths[map_name], write)
+            files[map_name] = filepaths[map_name]
+        return files
+
+
+def hilo_worker_bake(job):
+    # bake the maps of the job's groups, the main process updates the bake manifest
+    context = bpy.context
+    groups = hilo_scene_mesh_groups(context.scene)
+    baker = HiloBaker(context, groups, hilo_batch_report)
+    baker.setupRender(job['settings'], job['threads'], job['tile_size'])
+    # bake images of finished groups are freed before the next group
+    tracker = HiloDatablockTracker()
+    result = {'groups': {}}
+    for group_name, bake_hash, filepaths in job['groups']:
+        start = time.perf_counter()
+        try:
+            files = baker.bakeGroup(group_name, filepaths, job['settings'])
+        except RuntimeError as e:
+            # bake operator errors, e.g. missing uv layouts
+            result['groups'][group_name] = {'error': str(e)}
+            continue
+        finally:
+            tracker.purge()
+        result['groups'][group_name] = {'files': files,
+                                        'time':  time.perf_counter() - start}
+    return result
+
+
+hilo_worker_tasks['bake'] = hilo_worker_bake
+
+
+class HiloBakeFinalMeshes(bpy.types.Operator):
+    '''Bake normal and ambient occlusion maps from the final highpoly onto the final lowpoly meshes with Cycles in background worker processes'''
+    bl_idname = "objects.hilobakefinalmesh"
+    bl_label = "Hilo - Bake Final Meshes"
 
-        # select final lowpoly meshes
+    def execute(self, context):
+        # find mesh groups in scene
+        profiler = hilo_scene_profiler(context.scene)
+        try:
+            with profiler.phase(None, 'classify'):
+                groups = hilo_scene_mesh_groups(context.scene)
+            if (not HiloBaker(context, groups, self.report, profiler).bake()):
+                return {'CANCELLED'}
+            return {'FINISHED'}
+        finally:
+            profiler.finish(context.scene, self.report)
+
+
+class HiloMeshExporter:
+    def __init__(self, context, groups, report, profiler=None):
+        self.context = context
+        self.groups = groups
+        self.report = report  # same signature as `bpy.types.Operator.report`
+        self.profiler = profiler if (not profiler is None) else HiloProfiler()
+    def finalObjects(self, role, required):
+        # final meshes of all groups, None if a required final mesh is missing
+        result = []
+        for group_name in self.groups.group_names:
+            final_name = self.groups.getFinalNames(group_name)[role]
+            final_obj = bpy.data.objects.get(final_name)
+            if (final_obj is None):
+                if (required):
+                    self.report({'ERROR'}, 'could not find %s mesh %s. Recreate meshes and try again.' % (role, final_name))
+                    return None
+                continue
+            result.append(final_obj)
+        return result
+    def exportFilepath(self, filename):
+        # absolute output file path, creates the output directory
+        scene = self.context.scene
+        exportFilepath = bpy.path.abspath(scene.hilo_outputpath + filename + "." + scene.hilo_outputformat)
+        export_dir = os.path.dirname(exportFilepath)
+        if ((export_dir != '') and (not os.path.isdir(export_dir))):
+            os.makedirs(export_dir)
+        return exportFilepath
+    def exportObjects(self, objects, filename, filepath=None):
+        # export objects in the scene's output format, the file is replaced atomically
+        output_format = self.context.scene.hilo_outputformat
+        if (filepath is None):
+            filepath = self.exportFilepath(filename)
+        with self.profiler.phase(None, 'export', object=filename,
+                                 vertices=sum([len(obj.data.vertices) for obj in objects]),
+                                 polygons=sum([len(obj.data.polygons) for obj in objects])):
+            if (output_format in hilo_mesh_writers):
+                hilo_write_atomic(filepath, lambda temp_filepath: hilo_mesh_writers[output_format](temp_filepath, HiloObjectMeshes(objects)))
+            else:
+                hilo_write_atomic(filepath, lambda temp_filepath: self.exportFbx(objects, temp_filepath))
+        return filepath
+    def exportFbx(self, objects, filepath):
+        # select objects and export them with the bundled .fbx exporter,
+        # final meshes carry no modifiers to evaluate
         bpy.ops.object.select_all(action='DESELECT')
-        for i_group in range(0, groups.groupCount()):
-            group_name = groups.group_names[i_group]
-            lowpoly_name = group_name + context.scene.hilo_lowpolymeshsuffix
-            if (bpy.data.objects.find(lowpoly_name) == -1):
-                self.report({'ERROR'}, 'could not find lowpoly mesh %s. Recreate meshes and try again.' % (lowpoly_name))
-                return {'FINISHED'}
-            bpy.data.objects[lowpoly_name].select = True
-
-        # export selected objects as .fbx
-        self.report({'INFO'}, "  export lowpoly to .fbx file")
-        exportFilepath = bpy.path.abspath(context.scene.hilo_outputpath + context.scene.hilo_lowpolyfilename + ".fbx")
-        bpy.ops.export_scene.fbx(filepath=exportFilepath, 
+        for obj in objects:
+            obj.select = True
+        bpy.ops.export_scene.fbx(filepath=filepath, 
                                  check_existing=False, 
                                  use_selection=True, 
                                  object_types={'MESH'}, 
-                                 use_mesh_modifiers=True, 
+                                 use_mesh_modifiers=False, 
                                  bake_anim=False, 
                                  batch_mode='OFF')
+    def export(self):
+        # returns True if all files were exported
+        scene = self.context.scene
+        if (scene.hilo_exportmode == 'per-group'):
+            return self.exportGroups()
+        lowpoly_objects = self.finalObjects('lowpoly', required=True)
+        highpoly_objects = self.finalObjects('highpoly', required=True)
+        cage_objects = self.finalObjects('cage', required=False)
+        if ((lowpoly_objects is None) or (highpoly_objects is None)):
+            return False
+        files = [('lowpoly', scene.hilo_lowpolyfilename, lowpoly_objects),
+                 ('highpoly', scene.hilo_highpolyfilename, highpoly_objects)]
+        # a cage file is only created if there are any cage objects
+        if (len(cage_objects) > 0):
+            files.append(('cage', scene.hilo_cagefilename, cage_objects))
+        # one file per lod
+        for i_lod, role in enumerate(self.groups.getLodRoles(), 1):
+            lod_objects = self.finalObjects(role, required=False)
+            if (len(lod_objects) > 0):
+                files.append((role, scene.hilo_lowpolyfilename + '_LOD%d' % (i_lod), lod_objects))
+        return self.exportFiles(files)
+    def groupFilename(self, group_name, role):
+        # per-group file name from the filename template
+        suffix = self.groups.getFinalNames(group_name)[role][len(group_name):]
+        template = self.context.scene.hilo_exportfilenametemplate
+        return template.replace('$group', group_name).replace('$role', role).replace('$suffix', suffix)
+    def exportGroups(self):
+        # export one file set per mesh group and an index of groups, files, counts and bounds
+        scene = self.context.scene
+        # every group and role needs its own file, otherwise exports overwrite each other
+        template = scene.hilo_exportfilenametemplate
+        if (not '$group' in template):
+            self.report({'ERROR'}, 'filename template `%s` needs `$group`' % (template))
+            return False
+        if ((not '$role' in template) and (not '$suffix' in template)):
+            self.report({'ERROR'}, 'filename template `%s` needs `$role` or `$suffix`' % (template))
+            return False
+        index_filepath = bpy.path.abspath(scene.hilo_outputpath + hilo_index_filename)
+        index_dir = os.path.dirname(index_filepath)
+        files = []
+        index = {'format': scene.hilo_outputformat, 'groups': {}}
+        for group_name in self.groups.group_names:
+            final_names = self.groups.getFinalNames(group_name)
+            group_index = {'files': {}, 'statistics': {}, 'bounds': None}
+            bounds = []
+            for role in ['lowpoly', 'highpoly', 'cage'] + self.groups.getLodRoles():
+                final_obj = bpy.data.objects.get(final_names[role])
+                if (final_obj is None):
+                    # a cage file is only created if the group has a cage
+                    if (role in ('lowpoly', 'highpoly')):
+                        self.report({'ERROR'}, 'could not find %s mesh %s. Recreate meshes and try again.' % (role, final_names[role]))
+                        return False
+                    continue
+                filename = self.groupFilename(group_name, role)
+                files.append((role, filename, [final_obj]))
+                group_index['files'][role] = os.path.relpath(self.exportFilepath(filename), index_dir or os.curdir).replace(os.sep, '/')
+                group_index['statistics'][role] = hilo_mesh_statistics(final_obj.data)
+                object_bounds = hilo_object_bounds(final_obj)
+                if (not object_bounds is None):
+                    bounds.append(object_bounds)
+            if (len(bounds) > 0):
+                group_index['bounds'] = {'min': np.min([b[0] for b in bounds], axis=0).tolist(),
+                                         'max': np.max([b[1] for b in bounds], axis=0).tolist()}
+            index['groups'][group_name] = group_index
+        success = self.exportFiles(files)
+        # index of all groups for downstream jobs
+        def write(temp_filepath):
+            with open(temp_filepath, 'w') as index_file:
+                json.dump(index, index_file, indent=2, sort_keys=True)
+        if ((index_dir != '') and (not os.path.isdir(index_dir))):
+            os.makedirs(index_dir)
+        hilo_write_atomic(index_filepath, write)
+        return success
+    def exportSettings(self):
+        # settings that change the content of exported files
+        return {'format': self.context.scene.hilo_outputformat}
+    def contentHash(self, objects, settings):
+        # hash of the exported meshes, their transforms and the export settings
+        sha = hashlib.sha1()
+        sha.update(repr(sorted(settings.items())).encode('utf-8'))
+        for obj in objects:
+            sha.update(repr((obj.name, [tuple(row) for row in obj.matrix_world])).encode('utf-8'))
+            hilo_mesh_hash(sha, obj.data)
+        return sha.hexdigest()
+    def exportFiles(self, files):
+        # export [(role, filename, objects), ...], returns True if all files were written
+        scene = self.context.scene
+        settings = self.exportSettings()
+        manifest = HiloExportManifest(bpy.path.abspath(scene.hilo_outputpath + hilo_manifest_filename))
+        # skip files whose content hasn't changed since the last export
+        pending = []
+        for role, filename, objects in files:
+            filepath = self.exportFilepath(filename)
+            content_hash = self.contentHash(objects, settings)
+            if (scene.hilo_exportskipunchanged and manifest.isCurrent(filepath, content_hash)):
+                self.report({'INFO'}, "  %s unchanged, skip `%s`" % (role, filepath))
+                continue
+            pending.append((role, filename, objects, filepath, content_hash))
+        if (len(pending) == 0):
+            return True
+        writer = hilo_mesh_writers.get(scene.hilo_outputformat)
+        thread_count = scene.hilo_exportthreads if (scene.hilo_exportthreads > 0) else min(len(pending), 2 * (os.cpu_count() or 1))
+        try:
+            if ((writer is None) or (thread_count <= 1) or (len(pending) <= 1)):
+                failed = 0
+                for role, filename, objects, filepath, content_hash in pending:
+                    self.report({'INFO'}, "  export %s to `%s`" % (role, filepath))
+                    try:
+                        self.exportObjects(objects, filename, filepath)
+                    except Exception as e:
+                        failed += 1
+                        self.report({'ERROR'}, "  export %s to `%s` failed: %s" % (role, filepath, e))
+                        continue
+                    manifest.update(filepath, content_hash, settings, objects)
+                return (failed == 0)
+            return self.exportConcurrent(writer, pending, thread_count, manifest, settings)
+        finally:
+            manifest.save()
+    def exportConcurrent(self, writer, files, thread_count, manifest, settings):
+        # snapshot final meshes on the main thread, blender data must not be read from other threads
+        jobs = []
+        for role, filename, objects, filepath, content_hash in files:
+            with self.profiler.phase(None, 'snapshot', object=filename) as record:
+                meshes = list(HiloObjectMeshes(objects))
+                record['vertices'] = sum([buf.vertexCount() for name, buf in meshes])
+                record['polygons'] = sum([buf.polygonCount() for name, buf in meshes])
+            jobs.append((role, filename, objects, filepath, content_hash, meshes))
+        # serialize and write the files on a thread pool
+        self.report({'INFO'}, "  export %d .%s files in %d threads" % (len(jobs), self.context.scene.hilo_outputformat, min(thread_count, len(jobs))))
+        failed = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=thread_count) as executor:
+            futures = {}
+            for role, filename, objects, filepath, content_hash, meshes in jobs:
+                futures[executor.submit(self.writeFile, writer, filename, filepath, meshes)] = (role, objects, filepath, content_hash)
+            for future in concurrent.futures.as_completed(futures):
+                role, objects, filepath, content_hash = futures[future]
+                if (future.exception() is None):
+                    manifest.update(filepath, content_hash, settings, objects)
+                    self.report({'INFO'}, "  exported %s to `%s`" % (role, filepath))
+                else:
+                    failed += 1
+                    self.report({'ERROR'}, "  export %s to `%s` failed: %s" % (role, filepath, future.exception()))
+        return (failed == 0)
+    def writeFile(self, writer, filename, filepath, meshes):
+        # runs on an export thread
+        with self.profiler.phase(None, 'export', object=filename,
+                                 vertices=sum([buf.vertexCount() for name, buf in meshes]),
+                                 polygons=sum([buf.polygonCount() for name, buf in meshes])):
+            hilo_write_atomic(filepath, lambda temp_filepath: writer(temp_filepath, meshes))
 
-        # select final highpoly meshes
-        bpy.ops.object.select_all(action='DESELECT')
-        for i_group in range(0, groups.groupCount()):
-            group_name = groups.group_names[i_group]
-            highpoly_name = group_name + context.scene.hilo_highpolymeshsuffix
-            if (bpy.data.objects.find(highpoly_name) == -1):
-                self.report({'ERROR'}, 'could not find highpoly mesh %s. Recreate meshes and try again.' % (lowpoly_name))
-                return {'FINISHED'}
-            bpy.data.objects[highpoly_name].select = True
 
-        # export selected objects as .fbx
-        self.report({'INFO'}, "  export highpoly to .fbx file")
-        exportFilepath = bpy.path.abspath(context.scene.hilo_outputpath + context.scene.hilo_highpolyfilename + ".fbx")
-        bpy.ops.export_scene.fbx(filepath=exportFilepath, 
-                                 check_existing=False, 
-                                 use_selection=True, 
-                                 object_types={'MESH'}, 
-                                 use_mesh_modifiers=True, 
-                                 bake_anim=False, 
-                                 batch_mode='OFF')
+class HiloExportMeshes(bpy.types.Operator):
+    bl_idname = 'objects.hiloexportfinalmesh'
+    bl_label = 'Hilo - Export Final Meshes'
 
-        # select cage meshes
-        bpy.ops.object.select_all(action='DESELECT')
-        for i_group in range(0, groups.groupCount()):
-            group_name = groups.group_names[i_group]
-            cage_name = group_name + '_cage'
-            if (bpy.data.objects.find(cage_name) == -1):
-                pass
+    def execute(self, context):
+        # find mesh groups in scene
+        profiler = hilo_scene_profiler(context.scene)
+        try:
+            with profiler.phase(None, 'classify'):
+                groups = hilo_scene_mesh_groups(context.scene)
+            # export final meshes
+            if (not HiloMeshExporter(context, groups, self.report, profiler).export()):
+                return {'CANCELLED'}
+            return {'FINISHED'}
+        finally:
+            profiler.finish(context.scene, self.report)
+
+
+def hilo_batch_report(levels, message):
+    # `bpy.types.Operator.report` replacement for command line runs
+    sys.stderr.write('%s: %s\n' % ('/'.join(sorted(levels)), message))
+
+
+def hilo_batch_setting(scene, assignment):
+    # apply a `hilo_<setting>=<value>` command line override to the scene
+    name, value = assignment.split('=', 1)
+    if ((not name.startswith('hilo_')) or (not hasattr(scene, name))):
+        raise ValueError('unknown setting `%s`' % (name))
+    current = getattr(scene, name)
+    if (type(current) == bool):
+        value = value.lower() in ('1', 'true', 'yes', 'on')
+    elif (type(current) == int):
+        value = int(value)
+    elif (type(current) == float):
+        value = float(value)
+    setattr(scene, name, value)
+
+
+def main(argv=None):
+    # command line entry point, arguments follow blender's `--` separator:
+    # blender -b file.blend --python __init__.py -- --hilo-batch [options]
+    if (argv is None):
+        argv = sys.argv[sys.argv.index('--') + 1:] if ('--' in sys.argv) else []
+    parser = argparse.ArgumentParser(prog='hilo', description='Regenerate and export high-/lowpoly final meshes')
+    parser.add_argument('--hilo-batch', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--set', action='append', default=[], metavar='hilo_SETTING=VALUE', help='override a scene setting')
+    parser.add_argument('--no-build', action='store_true', help='do not regenerate final meshes')
+    parser.add_argument('--no-export', action='store_true', help='do not export final meshes')
+    parser.add_argument('--parallel', action='store_true', help='regenerate final meshes in background worker processes')
+    parser.add_argument('--analyze', action='store_true', help='measure lowpoly/highpoly coverage of each group')
+    parser.add_argument('--max-misses', type=int, default=None, metavar='N', help='fail if a group has more than N lowpoly vertices without highpoly surface (implies --analyze)')
+    parser.add_argument('--bake', action='store_true', help='bake normal/ao maps of the final meshes in background worker processes')
+    parser.add_argument('--report', help='write a JSON report to this file')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = {'file': bpy.data.filepath, 'status': 'ok', 'groups': {}}
+    profiler = None
+    try:
+        context = bpy.context
+        scene = context.scene
+        report['scene'] = scene.name
+        for assignment in args.set:
+            hilo_batch_setting(scene, assignment)
+        # find mesh groups in scene
+        profiler = hilo_scene_profiler(scene)
+        with profiler.phase(None, 'classify'):
+            groups = hilo_scene_mesh_groups(scene)
+        scene.update()
+        tracker = HiloDatablockTracker()
+        builder = HiloFinalMeshBuilder(context, groups, profiler, tracker=tracker)
+        build_times = {}
+        if (not args.no_build):
+            dirty_groups = builder.dirtyGroups(scene.hilo_incrementalrefresh)
+            if (args.parallel and (len(dirty_groups) > 0)):
+                build_times = hilo_parallel_rebuild_groups(context, builder, dirty_groups, hilo_batch_report)
+                if (build_times is None):
+                    raise RuntimeError('parallel build failed')
             else:
-                bpy.data.objects[cage_name].select = True
-
-        # export selected objects as .fbx
-        self.report({'INFO'}, "  export cage to .fbx file")
-        export_filepath = bpy.path.abspath(context.scene.hilo_outputpath + context.scene.hilo_cagefilename + ".fbx")
-        bpy.ops.export_scene.fbx(filepath=exportFilepath, 
-                                 check_existing=False, 
-                                 use_selection=True, 
-                                 object_types={'MESH'}, 
-                                 use_mesh_modifiers=True, 
-                                 bake_anim=False, 
-                                 batch_mode='OFF')
-
-        return {'FINISHED'}
+                build_times = builder.rebuildGroups(dirty_groups)
+            # new final meshes get their world matrices, analysis, bake and export read them
+            scene.update()
+        tracker.finish(scene, hilo_batch_report)
+        if (not builder.uv_cache is None):
+            report['uv_cache'] = builder.uv_cache.statistics()
+        for group_name in groups.group_names:
+            group_report = builder.finalStatistics(group_name)
+            group_report['build_time'] = build_times.get(group_name)
+            report['groups'][group_name] = group_report
+        if (args.analyze or (not args.max_misses is None)):
+            if (BVHTree is None):
+                raise RuntimeError('coverage analysis needs blender 2.76 or newer')
+            analyzer = HiloCoverageAnalyzer(context, groups, hilo_batch_report, profiler)
+            coverage = analyzer.analyze()
+            analyzer.reportResults(coverage)
+            for group_name, result in coverage.items():
+                report['groups'].setdefault(group_name, {})['coverage'] = result
+            if (not args.max_misses is None):
+                failed = [name for name, result in coverage.items() if ((result is None) or (result['misses'] > args.max_misses))]
+                if (len(failed) > 0):
+                    raise RuntimeError('coverage check failed for %s' % (', '.join(sorted(failed))))
+        if (args.bake):
+            bake_start = time.perf_counter()
+            if (not HiloBaker(context, groups, hilo_batch_report, profiler).bake()):
+                raise RuntimeError('bake failed')
+            report['bake_time'] = time.perf_counter() - bake_start
+        if (not args.no_export):
+            export_start = time.perf_counter()
+            if (not HiloMeshExporter(context, groups, hilo_batch_report, profiler).export()):
+                raise RuntimeError('export failed')
+            report['export_time'] = time.perf_counter() - export_start
+    except Exception as e:
+        report['status'] = 'error'
+        report['error'] = '%s: %s' % (type(e).__name__, e)
+        hilo_batch_report({'ERROR'}, report['error'])
+    # failed runs are profiled too
+    if (not profiler is None):
+        profiler.finish(bpy.context.scene, hilo_batch_report)
+        if (profiler.enabled):
+            report['profile'] = profiler.totals()
+    report['total_time'] = time.perf_counter() - start
+    if (not args.report is None):
+        with open(args.report, 'w') as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+    return 0 if (report['status'] == 'ok') else 1
 
 
 
 # register/unregister classes in blender
 # when blender executes the script as addon, `__name__` is "__main__"
 def register():
+    # group overview
+    bpy.utils.register_class(HiloGroupSummary)
+    bpy.types.Scene.hilo_groupsummary = bpy.props.CollectionProperty(type=HiloGroupSummary)
+    bpy.types.Scene.hilo_groupsummaryindex = bpy.props.IntProperty(name="Active Group", default=0, min=0)
+    bpy.utils.register_class(HiloGroupSummaryList)
     # panels
     bpy.utils.register_class(HiloObjectUnwrapSettingsPanel)
     bpy.utils.register_class(HiloMeshToolObjectPanel)
     bpy.utils.register_class(HiloMeshToolScenePanel)
+    bpy.utils.register_class(HiloGroupOverviewPanel)
     # operators
     bpy.utils.register_class(HiloUnwrapSelectedObjects)
     bpy.utils.register_class(HiloCopyUnwrapSettingsToSelected)
     bpy.utils.register_class(HiloSetObjectOriginToCursor)
+    bpy.utils.register_class(HiloPurgeOrphanMeshes)
     bpy.utils.register_class(HiloCreateFinalMesh)
     bpy.utils.register_class(HiloRefreshFinalMesh)
+    bpy.utils.register_class(HiloParallelRefreshFinalMesh)
     bpy.utils.register_class(HiloExportMeshes)
+    bpy.utils.register_class(HiloAnalyzeCoverage)
+    bpy.utils.register_class(HiloBakeFinalMeshes)
+    bpy.utils.register_class(HiloRefreshGroupSummary)
+    # handlers
+    bpy.app.handlers.scene_update_post.append(hilo_scene_update_post)
+    bpy.app.handlers.load_post.append(hilo_load_post)
     
 
 def unregister():
@@ -876,14 +3578,35 @@ def unregister():
     bpy.utils.unregister_class(HiloObjectUnwrapSettingsPanel)
     bpy.utils.unregister_class(HiloMeshToolObjectPanel)
     bpy.utils.unregister_class(HiloMeshToolScenePanel)
+    bpy.utils.unregister_class(HiloGroupOverviewPanel)
     # operators
     bpy.utils.unregister_class(HiloUnwrapSelectedObjects)
     bpy.utils.unregister_class(HiloCopyUnwrapSettingsToSelected)
     bpy.utils.unregister_class(HiloSetObjectOriginToCursor)
+    bpy.utils.unregister_class(HiloPurgeOrphanMeshes)
     bpy.utils.unregister_class(HiloCreateFinalMesh)
     bpy.utils.unregister_class(HiloRefreshFinalMesh)
+    bpy.utils.unregister_class(HiloParallelRefreshFinalMesh)
     bpy.utils.unregister_class(HiloExportMeshes)
+    bpy.utils.unregister_class(HiloAnalyzeCoverage)
+    bpy.utils.unregister_class(HiloBakeFinalMeshes)
+    bpy.utils.unregister_class(HiloRefreshGroupSummary)
+    # group overview
+    bpy.utils.unregister_class(HiloGroupSummaryList)
+    del bpy.types.Scene.hilo_groupsummaryindex
+    del bpy.types.Scene.hilo_groupsummary
+    bpy.utils.unregister_class(HiloGroupSummary)
+    # handlers
+    bpy.app.handlers.scene_update_post.remove(hilo_scene_update_post)
+    bpy.app.handlers.load_post.remove(hilo_load_post)
     
 
 if (__name__ == "__main__"):
-    register()
+    if ('--hilo-worker' in sys.argv):
+        # background worker process, see `HiloWorkerPool`
+        hilo_worker_main(sys.argv[sys.argv.index('--hilo-worker') + 1])
+    elif ('--hilo-batch' in sys.argv):
+        # command line run, no panels or operators are registered
+        sys.exit(main())
+    else:
+        register()
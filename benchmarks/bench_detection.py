@@ -0,0 +1,84 @@
+# benchmark mesh group detection without blender
+#
+#   python benchmarks/bench_detection.py [--groups 1000] [--output detection.json] [--baseline baseline.json]
+#
+# runs `HiloMeshGroups` against a pure-python stub of `bpy` (see `bpy_stub.py`)
+# for both `mesh-group-by-name` and `mesh-group-by-property` naming schemes.
+
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+import bpy_stub
+
+
+def synthetic_objects(mode, args):
+    # grouped source objects, helpers and unrelated objects in random order
+    objects = []
+    for i_group in range(0, args.groups):
+        group_name = 'asset%05d' % (i_group)
+        for i_obj in range(0, args.objects_per_group):
+            res = 'low' if (i_obj % 2 == 0) else 'high'
+            if (mode == 'mesh-group-by-name'):
+                objects.append(bpy_stub.Object('%s_%s.%03d' % (group_name, res, i_obj)))
+            else:
+                objects.append(bpy_stub.Object('part%07d' % (len(objects)), meshtype=res + 'poly', meshgroup=group_name))
+        if (mode == 'mesh-group-by-name'):
+            objects.append(bpy_stub.Object(group_name + ':origin', type='EMPTY'))
+            objects.append(bpy_stub.Object(group_name + ':cage'))
+        else:
+            objects.append(bpy_stub.Object('origin%07d' % (len(objects)), type='EMPTY', meshtype='origin', meshgroup=group_name))
+    for i_obj in range(0, args.noise_objects):
+        objects.append(bpy_stub.Object('prop%07d' % (i_obj)))
+    random.Random(0).shuffle(objects)
+    return objects
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Benchmark hilo mesh group detection without blender')
+    common.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    bpy = bpy_stub.install()
+    hilo = common.load_addon()
+    scene = bpy.context.scene
+
+    results = {}
+    for mode, label in (('mesh-group-by-name', 'name'), ('mesh-group-by-property', 'property')):
+        scene.hilo_groupdetectionmode = mode
+        objects = synthetic_objects(mode, args)
+        scene.objects = bpy_stub.Objects(objects)
+
+        def cold():
+            hilo.hilo_pattern_cache.clear()
+            hilo.HiloMeshGroups(objects)
+        def warm():
+            hilo.HiloMeshGroups(objects)
+        cache = hilo.HiloClassificationCache()
+        def cached():
+            hilo.HiloMeshGroups(objects, cache=cache)
+        groups = hilo.HiloMeshGroups(objects)
+        def lookups():
+            for group_name in groups.group_names:
+                groups.getLowpolyMeshes(group_name)
+                groups.getHighpolyMeshes(group_name)
+                groups.getOrigin(group_name)
+                groups.getCage(group_name)
+
+        results[label + '/classify-cold'] = common.measure(cold, args.repeat)
+        results[label + '/classify-warm'] = common.measure(warm, args.repeat)
+        cached()
+        results[label + '/classify-cached'] = common.measure(cached, args.repeat)
+        results[label + '/lookups'] = common.measure(lookups, args.repeat)
+        if (groups.groupCount() != args.groups):
+            sys.stderr.write('%s: expected %d groups, found %d\n' % (mode, args.groups, groups.groupCount()))
+            return 2
+
+    return common.finish('detection', args, results)
+
+
+if (__name__ == "__main__"):
+    sys.exit(main(sys.argv[1:]))
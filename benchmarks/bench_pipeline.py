@@ -0,0 +1,129 @@
+# benchmark the final mesh pipeline inside blender
+#
+#   blender --background --factory-startup --python benchmarks/bench_pipeline.py -- \
+#       [--groups 20] [--vertices 10000] [--subsurf 1] [--mode mesh-group-by-name] \
+#       [--unwrap smart-unwrap] [--output pipeline.json] [--baseline baseline.json]
+#
+# generates a synthetic scene of high- and lowpoly grid meshes and times
+# grouping (`HiloMeshGroups`), final mesh generation, auto-unwrap and export.
+
+import os
+import sys
+import math
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+import bpy
+
+
+def grid_mesh(name, vertices):
+    # square grid with roughly `vertices` vertices
+    size = max(2, int(math.sqrt(vertices)))
+    verts = [(x / float(size), y / float(size), 0.0) for y in range(0, size) for x in range(0, size)]
+    faces = [(y * size + x, y * size + x + 1, (y + 1) * size + x + 1, (y + 1) * size + x)
+             for y in range(0, size - 1) for x in range(0, size - 1)]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    return mesh
+
+
+def blender_group(name):
+    group = bpy.data.groups.get(name)
+    if (group is None):
+        group = bpy.data.groups.new(name)
+    return group
+
+
+def synthetic_scene(scene, args):
+    # high- and lowpoly source objects with modifier stacks, origins and noise objects
+    lowpoly_mesh = grid_mesh('bench_low', max(4, args.vertices // 100))
+    highpoly_mesh = grid_mesh('bench_high', args.vertices)
+    for i_group in range(0, args.groups):
+        group_name = 'asset%04d' % (i_group)
+        for i_obj in range(0, args.objects_per_group):
+            is_lowpoly = (i_obj % 2 == 0)
+            res = 'low' if is_lowpoly else 'high'
+            if (args.mode == 'mesh-group-by-name'):
+                name = '%s_%s.%03d' % (group_name, res, i_obj)
+            else:
+                name = 'part%07d' % (len(scene.objects))
+            obj = bpy.data.objects.new(name, lowpoly_mesh if is_lowpoly else highpoly_mesh)
+            obj.location = (i_group * 2.0, i_obj * 0.1, 0.0)
+            obj.hilo_meshtype = res + 'poly'
+            obj.hilo_meshgroup = group_name
+            if ((not is_lowpoly) and (args.subsurf > 0)):
+                modifier = obj.modifiers.new('Subsurf', 'SUBSURF')
+                modifier.levels = args.subsurf
+            scene.objects.link(obj)
+            if (args.mode == 'mesh-group-by-group'):
+                blender_group(group_name + '_' + res).objects.link(obj)
+        origin = bpy.data.objects.new(group_name + ':origin', None)
+        origin.location = (i_group * 2.0, 0.0, 0.0)
+        origin.hilo_meshtype = 'origin'
+        origin.hilo_meshgroup = group_name
+        scene.objects.link(origin)
+        if (args.mode == 'mesh-group-by-group'):
+            blender_group(group_name + '_origin').objects.link(origin)
+    for i_obj in range(0, args.noise_objects):
+        scene.objects.link(bpy.data.objects.new('prop%07d' % (i_obj), None))
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Benchmark the hilo final mesh pipeline inside blender')
+    common.add_arguments(parser)
+    parser.add_argument('--vertices', type=int, default=10000, help='vertices per highpoly source mesh')
+    parser.add_argument('--subsurf', type=int, default=1, help='subsurf levels on highpoly source objects')
+    parser.add_argument('--mode', default='mesh-group-by-name', choices=['mesh-group-by-name', 'mesh-group-by-property', 'mesh-group-by-group'])
+    parser.add_argument('--unwrap', default='smart-unwrap', choices=['none', 'smart-unwrap', 'cube-project', 'unwrap'])
+    parser.add_argument('--format', default='fbx', help='`hilo_outputformat` used for the export case')
+    args = parser.parse_args(argv)
+
+    hilo = common.load_addon()
+    context = bpy.context
+    scene = context.scene
+    scene.hilo_groupdetectionmode = args.mode
+    synthetic_scene(scene, args)
+    scene.update()
+    output_dir = tempfile.mkdtemp(prefix='hilo_bench_')
+    scene.hilo_outputpath = output_dir + os.sep
+    scene.hilo_outputformat = args.format
+    # measure the work itself, not the caches that skip it on repeats
+    scene.hilo_uvcache = False
+    scene.hilo_exportskipunchanged = False
+    report = lambda levels, message: None
+
+    results = {}
+    try:
+        def grouping():
+            hilo.hilo_classification_caches.clear()
+            hilo.hilo_scene_mesh_groups(scene)
+        results['grouping'] = common.measure(grouping, args.repeat)
+        groups = hilo.hilo_scene_mesh_groups(scene)
+        builder = hilo.HiloFinalMeshBuilder(context, groups)
+        dirty_groups = builder.dirtyGroups(False)
+
+        def build(unwrap_mode):
+            def run():
+                scene.hilo_autounwrapmode = unwrap_mode
+                builder.rebuildGroups(dirty_groups)
+            return run
+        results['build'] = common.measure(build('none'), args.repeat)
+        if (args.unwrap != 'none'):
+            results['build+unwrap/' + args.unwrap] = common.measure(build(args.unwrap), args.repeat)
+
+        def export():
+            hilo.HiloMeshExporter(context, groups, report).export()
+        results['export/' + args.format] = common.measure(export, args.repeat)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return common.finish('pipeline', args, results)
+
+
+if (__name__ == "__main__"):
+    sys.exit(main(common.blender_argv()))
@@ -0,0 +1,80 @@
+# pure-python stand-in for the parts of `bpy` used by mesh group detection
+#
+# allows `HiloMeshGroups` and the detection strategies to be benchmarked
+# without blender. install it with `install()` before loading the addon.
+
+import sys
+import types
+
+
+class Vector(tuple):
+    def copy(self):
+        return Vector(self)
+
+
+class Object:
+    def __init__(self, name, type='MESH', meshtype='ignore', meshgroup='', location=(0.0, 0.0, 0.0)):
+        self.name = name
+        self.type = type
+        self.hilo_meshtype = meshtype
+        self.hilo_meshgroup = meshgroup
+        self.location = Vector(location)
+        self.properties = {}
+    def get(self, key, default=None):
+        return self.properties.get(key, default)
+    def as_pointer(self):
+        return id(self)
+
+
+class Objects(list):
+    def values(self):
+        return list(self)
+    def keys(self):
+        return [obj.name for obj in self]
+    def get(self, name, default=None):
+        for obj in self:
+            if (obj.name == name):
+                return obj
+        return default
+
+
+class Scene:
+    def __init__(self, name='Scene'):
+        self.name = name
+        self.objects = Objects()
+        self.cursor_location = Vector((0.0, 0.0, 0.0))
+        self.hilo_lowpolymeshsuffix = '_low'
+        self.hilo_highpolymeshsuffix = '_high'
+        self.hilo_groupdetectionmode = 'mesh-group-by-name'
+        self.hilo_groupnamepattern = '$group$res.*'
+        self.hilo_helpernamepattern = '$group:*'
+        self.hilo_autodecimate = 'none'
+        self.hilo_lodcount = 0
+    def update(self):
+        pass
+
+
+def _property(*args, **kwargs):
+    return (args, kwargs)
+
+
+def _persistent(function):
+    return function
+
+
+def install():
+    # register the stub as `bpy` and return it
+    bpy = types.ModuleType('bpy')
+    bpy.props = types.SimpleNamespace(StringProperty=_property, BoolProperty=_property, IntProperty=_property,
+                                      FloatProperty=_property, EnumProperty=_property,
+                                      CollectionProperty=_property, PointerProperty=_property)
+    bpy.types = types.SimpleNamespace(Panel=object, Operator=object, PropertyGroup=object, UIList=object,
+                                      Scene=type('Scene', (), {}), Object=type('Object', (), {}))
+    bpy.app = types.SimpleNamespace(binary_path='blender', version=(2, 76, 0),
+                                    handlers=types.SimpleNamespace(persistent=_persistent, scene_update_post=[], load_post=[]))
+    bpy.utils = types.SimpleNamespace(register_class=lambda cls: None, unregister_class=lambda cls: None)
+    bpy.path = types.SimpleNamespace(abspath=lambda path: path)
+    bpy.data = types.SimpleNamespace(objects=Objects(), filepath='')
+    bpy.context = types.SimpleNamespace(scene=Scene())
+    sys.modules['bpy'] = bpy
+    return bpy
@@ -0,0 +1,79 @@
+# shared helpers of the hilo benchmark suite
+#
+# results are written as JSON:
+#   {"benchmark": name, "params": {...}, "results": {case: seconds, ...}}
+# and can be compared against a stored baseline file of the same format.
+
+import os
+import sys
+import json
+import time
+import platform
+import importlib.util
+
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '__init__.py')
+
+
+def load_addon():
+    # import the addon from the repository, independent of the install location
+    spec = importlib.util.spec_from_file_location('hilo', ADDON_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def add_arguments(parser):
+    parser.add_argument('--groups', type=int, default=100, help='number of mesh groups')
+    parser.add_argument('--objects-per-group', type=int, default=4, help='lowpoly and highpoly source objects per group')
+    parser.add_argument('--noise-objects', type=int, default=1000, help='objects which do not belong to any group')
+    parser.add_argument('--repeat', type=int, default=5, help='repetitions per case, the fastest one is reported')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare results against this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown against the baseline (0.25 = 25%%)')
+
+
+def measure(function, repeat):
+    # returns the fastest wall time of `repeat` runs
+    best = None
+    for i in range(0, repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if ((best is None) or (elapsed < best)):
+            best = elapsed
+    return best
+
+
+def finish(benchmark, args, results):
+    # print and write results, compare them against the baseline
+    # returns the process exit code
+    document = {'benchmark': benchmark,
+                'python':    platform.python_version(),
+                'params':    dict((key, value) for key, value in vars(args).items() if not key in ('output', 'baseline')),
+                'results':   results}
+    for case in sorted(results):
+        print('%-40s %10.4fs' % (case, results[case]))
+    if (not args.output is None):
+        with open(args.output, 'w') as output_file:
+            json.dump(document, output_file, indent=2, sort_keys=True)
+    if (args.baseline is None):
+        return 0
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)['results']
+    regressions = 0
+    for case in sorted(results):
+        if (not case in baseline) or (baseline[case] <= 0.0):
+            continue
+        ratio = results[case] / baseline[case]
+        status = 'ok'
+        if (ratio > 1.0 + args.tolerance):
+            status = 'REGRESSION'
+            regressions += 1
+        print('%-40s %6.2fx baseline  %s' % (case, ratio, status))
+    return 1 if (regressions > 0) else 0
+
+
+def blender_argv():
+    # arguments after blender's `--` separator
+    return sys.argv[sys.argv.index('--') + 1:] if ('--' in sys.argv) else []